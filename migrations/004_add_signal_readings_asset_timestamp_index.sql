@@ -0,0 +1,13 @@
+-- Migration: Add composite index for recent signal reading lookups
+-- Date: 2026-10-15
+-- Description: Lets the map query (asset_id IN (...) AND timestamp >= ?) use an
+-- index range scan instead of scanning signal_readings.
+-- SQLite databases get this index automatically on startup.
+
+-- SQLite
+CREATE INDEX IF NOT EXISTS ix_signal_readings_asset_timestamp
+    ON signal_readings (asset_id, timestamp);
+
+-- PostgreSQL (run outside a transaction to avoid locking the table):
+-- CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_signal_readings_asset_timestamp
+--     ON signal_readings (asset_id, timestamp);
@@ -0,0 +1,14 @@
+-- Migration: Add covering index for recent probe log aggregation
+-- Date: 2026-10-15
+-- Description: Lets the secondary reporter's per-device average over a recent
+-- window (timestamp >= ? GROUP BY asset_id, avg(signal_strength)) be answered
+-- from the index alone instead of scanning probe_logs.
+-- SQLite databases get this index automatically on startup.
+
+-- SQLite
+CREATE INDEX IF NOT EXISTS ix_probe_logs_timestamp_asset_signal
+    ON probe_logs (timestamp, asset_id, signal_strength);
+
+-- PostgreSQL (run outside a transaction to avoid locking the table):
+-- CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_probe_logs_timestamp_asset_signal
+--     ON probe_logs (timestamp, asset_id, signal_strength);
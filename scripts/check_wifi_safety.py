@@ -6,104 +6,156 @@ Checks if a WiFi interface is safe to put into monitor mode without
 disconnecting the user from the network.
 """
 
+import json
 import subprocess
 import sys
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple
+
+
+def _run(cmd: list[str]) -> subprocess.CompletedProcess:
+    """Run a short-lived command and capture its output."""
+    # close_fds=False skips closing every inherited descriptor in the child,
+    # which is slow when RLIMIT_NOFILE is high
+    return subprocess.run(
+        cmd,
+        capture_output=True,
+        text=True,
+        close_fds=False,
+        check=False,
+        stdin=subprocess.DEVNULL,
+    )
 
 
-def get_interface_status(interface: str) -> dict:
-    """Get detailed status of a WiFi interface."""
-    status = {
-        "exists": False,
-        "is_up": False,
-        "is_connected": False,
-        "has_ip": False,
-        "ssid": None,
-        "ip_address": None,
-        "is_only_interface": False,
-    }
+def gather_system_state(interface: Optional[str] = None) -> dict:
+    """
+    Collect the network state needed for the safety checks.
 
-    # Check if interface exists
-    try:
-        result = subprocess.run(
-            ["ip", "link", "show", interface],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode == 0:
-            status["exists"] = True
-            status["is_up"] = "UP" in result.stdout
-    except Exception:
-        return status
+    Runs ``ip -j addr``, ``ip -j route show default`` and ``iw dev`` once
+    each, so checking several interfaces doesn't spawn a new set of processes
+    per interface. ``ip -j addr`` reports link flags and addresses together.
+
+    Args:
+        interface: Only query link/address details for this interface.
+    """
+    state = {
+        "links": {},
+        "addresses": {},
+        "default_routes": set(),
+        "wifi": {},
+    }
 
-    # Check if connected to a network
+    # Link flags and IPv4 addresses per interface
+    cmd = ["ip", "-j", "addr", "show"]
+    if interface:
+        cmd += ["dev", interface]
     try:
-        result = subprocess.run(
-            ["iw", interface, "info"],
-            capture_output=True,
-            text=True,
-        )
+        result = _run(cmd)
         if result.returncode == 0:
-            for line in result.stdout.split('\n'):
-                if 'ssid' in line.lower():
-                    ssid = line.split()[-1]
-                    if ssid and ssid != "not":
-                        status["ssid"] = ssid
-                        status["is_connected"] = True
+            for entry in json.loads(result.stdout or "[]"):
+                name = entry["ifname"]
+                state["links"][name] = entry
+                state["addresses"][name] = [
+                    addr["local"]
+                    for addr in entry.get("addr_info", [])
+                    if addr.get("family") == "inet"
+                ]
     except Exception:
         pass
 
-    # Check if interface has IP address
+    # Interfaces carrying a default route
     try:
-        result = subprocess.run(
-            ["ip", "addr", "show", interface],
-            capture_output=True,
-            text=True,
-        )
+        result = _run(["ip", "-j", "route", "show", "default"])
         if result.returncode == 0:
-            for line in result.stdout.split('\n'):
-                if 'inet ' in line:
-                    ip = line.strip().split()[1].split('/')[0]
-                    status["has_ip"] = True
-                    status["ip_address"] = ip
+            for route in json.loads(result.stdout or "[]"):
+                if route.get("dev"):
+                    state["default_routes"].add(route["dev"])
     except Exception:
         pass
 
-    # Check if this is the only network interface with connectivity
+    # WiFi interfaces and the SSID each one is connected to
     try:
-        result = subprocess.run(
-            ["ip", "route", "show", "default"],
-            capture_output=True,
-            text=True,
-        )
+        result = _run(["iw", "dev"])
         if result.returncode == 0:
-            # Count how many interfaces have default routes
-            interfaces_with_routes = set()
+            current = None
             for line in result.stdout.split('\n'):
-                if 'dev' in line:
-                    parts = line.split()
-                    if 'dev' in parts:
-                        idx = parts.index('dev') + 1
-                        if idx < len(parts):
-                            interfaces_with_routes.add(parts[idx])
-
-            if interface in interfaces_with_routes and len(interfaces_with_routes) == 1:
-                status["is_only_interface"] = True
+                fields = line.split(None, 1)
+                if not fields:
+                    continue
+                if fields[0] == "Interface":
+                    current = line.split()[-1]
+                    state["wifi"][current] = None
+                elif fields[0] == "ssid" and current and len(fields) > 1:
+                    state["wifi"][current] = fields[1].strip()
     except Exception:
         pass
 
+    return state
+
+
+def get_interface_status(interface: str, state: Optional[dict] = None) -> dict:
+    """
+    Get detailed status of a WiFi interface.
+
+    Args:
+        interface: Interface name (e.g. wlan0).
+        state: Result of gather_system_state(). Gathered on demand if omitted.
+    """
+    if state is None:
+        state = gather_system_state(interface)
+
+    status = {
+        "exists": False,
+        "is_up": False,
+        "is_connected": False,
+        "has_ip": False,
+        "ssid": None,
+        "ip_address": None,
+        "is_only_interface": False,
+    }
+
+    link = state["links"].get(interface)
+    if link is None:
+        return status
+
+    status["exists"] = True
+    status["is_up"] = "UP" in link.get("flags", [])
+
+    # Connected to a network
+    ssid = state["wifi"].get(interface)
+    if ssid:
+        status["ssid"] = ssid
+        status["is_connected"] = True
+
+    # Has an IP address
+    addresses = state["addresses"].get(interface)
+    if addresses:
+        status["has_ip"] = True
+        status["ip_address"] = addresses[-1]
+
+    # Only network interface with a default route
+    routes = state["default_routes"]
+    if interface in routes and len(routes) == 1:
+        status["is_only_interface"] = True
+
     return status
 
 
-def check_interface_safety(interface: str) -> Tuple[bool, str, str]:
+def check_interface_safety(
+    interface: str, state: Optional[dict] = None
+) -> Tuple[bool, str, str]:
     """
     Check if it's safe to put an interface into monitor mode.
 
+    Args:
+        interface: Interface name (e.g. wlan0).
+        state: Result of gather_system_state(). Gathered on demand if omitted.
+
     Returns:
         (is_safe, risk_level, message)
         risk_level: "safe", "warning", "danger"
     """
-    status = get_interface_status(interface)
+    status = get_interface_status(interface, state)
 
     if not status["exists"]:
         return False, "danger", f"Interface {interface} does not exist"
@@ -135,37 +187,38 @@ def check_interface_safety(interface: str) -> Tuple[bool, str, str]:
     return True, "safe", f"✓ Safe to use {interface}"
 
 
-def list_wifi_interfaces() -> list:
+def list_wifi_interfaces(state: Optional[dict] = None) -> list:
     """List all WiFi interfaces on the system."""
-    interfaces = []
-    try:
-        result = subprocess.run(
-            ["iw", "dev"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode == 0:
-            for line in result.stdout.split('\n'):
-                if 'Interface' in line:
-                    interface = line.split()[-1]
-                    interfaces.append(interface)
-    except Exception:
-        pass
-    return interfaces
+    if state is None:
+        state = gather_system_state()
+    return list(state["wifi"])
+
+
+@lru_cache(maxsize=1)
+def check_all_interfaces() -> tuple:
+    """Run the safety check on every WiFi interface: ((iface, result), ...)."""
+    state = gather_system_state()
+    return tuple(
+        (iface, check_interface_safety(iface, state))
+        for iface in list_wifi_interfaces(state)
+    )
 
 
-def suggest_safe_interface() -> Optional[str]:
-    """Suggest a safe interface to use for monitoring."""
-    interfaces = list_wifi_interfaces()
+def suggest_safe_interface(results: Optional[Sequence] = None) -> Optional[str]:
+    """
+    Suggest a safe interface to use for monitoring.
 
-    # Check each interface
-    safe_interfaces = []
-    for iface in interfaces:
-        is_safe, risk, msg = check_interface_safety(iface)
-        if is_safe and risk == "safe":
-            safe_interfaces.append(iface)
+    Args:
+        results: (iface, (is_safe, risk, message)) pairs already computed,
+            e.g. by check_all_interfaces(). Checked on demand if omitted.
+    """
+    if results is None:
+        results = check_all_interfaces()
 
-    return safe_interfaces[0] if safe_interfaces else None
+    return next(
+        (iface for iface, (is_safe, risk, _) in results if is_safe and risk == "safe"),
+        None,
+    )
 
 
 def main():
@@ -196,14 +249,14 @@ def main():
     if args.list or not args.interface:
         print("Available WiFi Interfaces:")
         print("=" * 60)
-        interfaces = list_wifi_interfaces()
-        if not interfaces:
+        results = check_all_interfaces()
+        state = gather_system_state()
+        if not results:
             print("No WiFi interfaces found")
             return 1
 
-        for iface in interfaces:
-            is_safe, risk, msg = check_interface_safety(iface)
-            status = get_interface_status(iface)
+        for iface, (is_safe, risk, msg) in results:
+            status = get_interface_status(iface, state)
 
             # Print interface name with color coding
             if risk == "danger":
@@ -227,7 +280,7 @@ def main():
         print("\n" + "=" * 60)
 
         # Suggest safe interface
-        safe = suggest_safe_interface()
+        safe = suggest_safe_interface(results)
         if safe:
             print(f"\n💡 Recommended: Use {safe} for monitor mode")
         else:
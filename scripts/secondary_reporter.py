@@ -16,23 +16,26 @@ import argparse
 import asyncio
 import json
 import logging
+import math
 import os
 import socket
 import sys
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
 import httpx
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+import orjson
+from sqlalchemy import func, select
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from manomonitor.config import settings
+from manomonitor.database.connection import async_session_maker, engine
 from manomonitor.database.models import ProbeLog, Asset
+from manomonitor.utils.cache import TTLCache
 
 logging.basicConfig(
     level=logging.INFO,
@@ -40,25 +43,66 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# HTTP/2 needs the h2 package (httpx[http2]); fall back to HTTP/1.1 without it
+try:
+    import h2  # noqa: F401
 
-def discover_primary_monitor(timeout: float = 5.0) -> Optional[str]:
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Concurrent probes during subnet discovery (bounded to avoid running out of fds)
+DISCOVERY_CONCURRENCY = 256
+
+# URLs that didn't answer as a ManoMonitor recently; a repeat discovery in the
+# same process skips them instead of waiting out their timeouts again
+_negative_probes = TTLCache(ttl=60.0)
+
+# Where the last discovered primary URL is remembered between runs
+LAST_PRIMARY_FILE = settings.data_dir / "last_primary.json"
+
+
+def load_last_primary() -> Optional[str]:
+    """Return the primary URL found by a previous discovery, if any."""
+    try:
+        return json.loads(LAST_PRIMARY_FILE.read_text()).get("url")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def save_last_primary(url: str) -> None:
+    """Remember a discovered primary URL for the next run."""
+    try:
+        LAST_PRIMARY_FILE.parent.mkdir(parents=True, exist_ok=True)
+        LAST_PRIMARY_FILE.write_text(json.dumps({"url": url}))
+    except OSError as e:
+        logger.debug(f"Could not save primary URL: {e}")
+
+
+async def discover_primary_monitor(timeout: float = 5.0) -> Optional[str]:
     """
     Auto-discover primary monitor on local network.
 
     Scans common ports (8080, 8000, 5000) on local subnet for ManoMonitor.
+    Candidates are probed concurrently, so a full /24 scan takes about as
+    long as the slowest probe rather than the sum of all of them. The last
+    primary found is tried first and the scan is skipped if it still answers.
     """
     logger.info("🔍 Auto-discovering primary monitor on network...")
 
+    last_url = load_last_primary()
+    if last_url:
+        async with httpx.AsyncClient() as client:
+            if await check_manomonitor_endpoint(last_url, client, timeout=1.0):
+                logger.info(f"✓ Primary monitor still at {last_url}")
+                return last_url
+
     # Get local IP and subnet
     try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))
-        local_ip = s.getsockname()[0]
-        s.close()
-
-        # Parse subnet (assume /24)
-        ip_parts = local_ip.split('.')
-        subnet = f"{ip_parts[0]}.{ip_parts[1]}.{ip_parts[2]}"
+        local_ip, subnet = await asyncio.to_thread(_get_local_subnet)
 
         logger.info(f"Local subnet: {subnet}.0/24")
 
@@ -72,27 +116,31 @@ def discover_primary_monitor(timeout: float = 5.0) -> Optional[str]:
             f"{subnet}.10",
             f"{subnet}.50",
         ]
+        other_ips = [
+            f"{subnet}.{i}" for i in range(2, 255) if f"{subnet}.{i}" not in priority_ips
+        ]
 
-        for ip in priority_ips:
-            if ip == local_ip:
-                continue
-            for port in ports:
-                url = f"http://{ip}:{port}"
-                if check_manomonitor_endpoint(url, timeout=1.0):
-                    logger.info(f"✓ Found primary monitor at {url}")
-                    return url
-
-        # If not found, scan full subnet (slower)
-        logger.info("Scanning full subnet... (this may take a minute)")
-        for i in range(2, 255):
-            ip = f"{subnet}.{i}"
-            if ip == local_ip:
-                continue
-            for port in ports:
-                url = f"http://{ip}:{port}"
-                if check_manomonitor_endpoint(url, timeout=0.5):
-                    logger.info(f"✓ Found primary monitor at {url}")
-                    return url
+        async with httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=DISCOVERY_CONCURRENCY * 2)
+        ) as client:
+            url = await _find_manomonitor(
+                client,
+                [f"http://{ip}:{port}" for ip in priority_ips if ip != local_ip for port in ports],
+                timeout=1.0,
+            )
+            if not url:
+                # If not found, scan full subnet
+                logger.info("Scanning full subnet...")
+                url = await _find_manomonitor(
+                    client,
+                    [f"http://{ip}:{port}" for ip in other_ips if ip != local_ip for port in ports],
+                    timeout=0.5,
+                )
+
+        if url:
+            logger.info(f"✓ Found primary monitor at {url}")
+            save_last_primary(url)
+            return url
     except Exception as e:
         logger.debug(f"Discovery error: {e}")
 
@@ -100,11 +148,81 @@ def discover_primary_monitor(timeout: float = 5.0) -> Optional[str]:
     return None
 
 
-def check_manomonitor_endpoint(url: str, timeout: float = 2.0) -> bool:
+def get_local_ip() -> str:
+    """
+    Get this machine's primary IPv4 address.
+
+    Uses the addresses the hostname resolves to locally; only if those are
+    all loopback does it fall back to asking the routing table (a UDP
+    "connect" sends no packets, but does consult routes).
+    """
+    try:
+        for *_, sockaddr in socket.getaddrinfo(
+            socket.gethostname(), None, socket.AF_INET, socket.SOCK_STREAM
+        ):
+            ip = sockaddr[0]
+            if not ip.startswith("127."):
+                return ip
+    except OSError:
+        pass
+
+    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        s.connect(("8.8.8.8", 80))
+        return s.getsockname()[0]
+    finally:
+        s.close()
+
+
+@lru_cache(maxsize=1)
+def _get_local_subnet() -> tuple[str, str]:
+    """
+    Local IP and its /24 subnet prefix (e.g. "192.168.1"), resolved once.
+
+    The address doesn't change for the life of the process in practice, so
+    repeat discoveries reuse it.
+    """
+    local_ip = get_local_ip()
+
+    # Parse subnet (assume /24)
+    ip_parts = local_ip.split('.')
+    return local_ip, f"{ip_parts[0]}.{ip_parts[1]}.{ip_parts[2]}"
+
+
+async def _find_manomonitor(
+    client: httpx.AsyncClient, urls: list[str], timeout: float
+) -> Optional[str]:
+    """Probe all URLs concurrently and return the first ManoMonitor found."""
+    semaphore = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+
+    async def probe(url: str) -> Optional[str]:
+        if _negative_probes.get(url):
+            return None
+        async with semaphore:
+            if await check_manomonitor_endpoint(url, client, timeout=timeout):
+                return url
+        _negative_probes.set(url, True)
+        return None
+
+    tasks = [asyncio.create_task(probe(url)) for url in urls]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            url = await next_done
+            if url:
+                return url
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    return None
+
+
+async def check_manomonitor_endpoint(
+    url: str, client: httpx.AsyncClient, timeout: float = 2.0
+) -> bool:
     """Check if URL is a ManoMonitor instance."""
     try:
-        import requests
-        response = requests.get(f"{url}/api/status", timeout=timeout)
+        response = await client.get(f"{url}/api/status", timeout=timeout)
         if response.status_code == 200:
             data = response.json()
             # Check for ManoMonitor-specific fields
@@ -115,16 +233,34 @@ def check_manomonitor_endpoint(url: str, timeout: float = 2.0) -> bool:
     return False
 
 
-async def get_primary_api_key(primary_url: str) -> Optional[str]:
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Create the client used for all requests to the primary monitor.
+
+    One client is shared by the API key fetch, the connection test and the
+    periodic reports, so they reuse a keep-alive connection instead of
+    paying a new handshake each time. Connection failures are retried twice
+    by the transport.
+    """
+    return httpx.AsyncClient(
+        timeout=30.0,
+        transport=httpx.AsyncHTTPTransport(
+            retries=2,
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        ),
+    )
+
+
+async def get_primary_api_key(primary_url: str, client: httpx.AsyncClient) -> Optional[str]:
     """Fetch API key from primary monitor."""
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{primary_url}/api/monitors/local-api-key")
-            response.raise_for_status()
-            data = response.json()
+        response = await client.get(f"{primary_url}/api/monitors/local-api-key", timeout=5.0)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
 
-            if data and data.get("api_key"):
-                return data["api_key"]
+        if data and data.get("api_key"):
+            return data["api_key"]
     except Exception as e:
         logger.debug(f"Failed to get API key: {e}")
     return None
@@ -147,21 +283,21 @@ class SecondaryReporter:
         api_key: str,
         report_interval: int = 30,
         batch_size: int = 100,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         self.primary_url = primary_url.rstrip("/")
         self.api_key = api_key
         self.report_interval = report_interval
         self.batch_size = batch_size
 
-        # Database setup
-        db_url = settings.get_database_url()
-        self.engine = create_async_engine(db_url, echo=False)
-        self.async_session = sessionmaker(
-            self.engine, class_=AsyncSession, expire_on_commit=False
-        )
+        # Database setup: share the application's engine, which is already
+        # pool-tuned for the configured driver (and applies SQLite pragmas)
+        self.engine = engine
+        self.async_session = async_session_maker
 
-        # HTTP client
-        self.http_client: Optional[httpx.AsyncClient] = None
+        # HTTP client (created on start unless one is shared with us)
+        self.http_client = http_client
+        self._owns_http_client = http_client is None
 
         # Tracking
         self.last_report_time: Optional[datetime] = None
@@ -174,7 +310,8 @@ class SecondaryReporter:
         logger.info(f"📡 Primary URL: {self.primary_url}")
         logger.info(f"⏱️  Report interval: {self.report_interval} seconds")
 
-        self.http_client = httpx.AsyncClient(timeout=30.0)
+        if self.http_client is None:
+            self.http_client = create_http_client()
 
         # Test connection to primary
         try:
@@ -185,12 +322,16 @@ class SecondaryReporter:
             logger.error("Please check PRIMARY_URL and network connectivity")
             return
 
-        # Main reporting loop
+        # Main reporting loop. Reports are scheduled on a fixed clock, so the
+        # time spent querying and posting doesn't stretch the interval.
+        loop = asyncio.get_running_loop()
+        next_report = loop.time()
         try:
             while True:
                 try:
                     await self._report_readings()
                     self.consecutive_errors = 0
+                    next_report += self.report_interval
                 except Exception as e:
                     self.consecutive_errors += 1
                     logger.error(f"Error reporting readings: {e}")
@@ -199,17 +340,23 @@ class SecondaryReporter:
                         logger.error(
                             "Too many consecutive errors. Check primary monitor."
                         )
-                        await asyncio.sleep(self.report_interval * 2)
+                        next_report += self.report_interval * 2
                     else:
-                        await asyncio.sleep(self.report_interval)
-                else:
-                    await asyncio.sleep(self.report_interval)
+                        next_report += self.report_interval
+
+                delay = next_report - loop.time()
+                if delay < -self.report_interval:
+                    # More than two intervals behind: skip the missed reports
+                    logger.warning("Reporting is falling behind, skipping missed intervals")
+                    next_report = loop.time()
+                await asyncio.sleep(max(0.0, delay))
 
         except KeyboardInterrupt:
             logger.info("Shutting down...")
         finally:
-            if self.http_client:
+            if self.http_client and self._owns_http_client:
                 await self.http_client.aclose()
+            await self.engine.dispose()
 
     async def _test_connection(self):
         """Test connection to primary monitor."""
@@ -223,50 +370,31 @@ class SecondaryReporter:
         if self.last_report_time:
             cutoff_time = max(cutoff_time, self.last_report_time)
 
-        # Query database for recent readings
+        # Average signal per MAC over the window, computed in the database
         async with self.async_session() as session:
-            # Get distinct MAC addresses with their latest readings
-            stmt = select(ProbeLog).where(ProbeLog.timestamp >= cutoff_time)
-            result = await session.execute(stmt)
-            probe_logs = result.scalars().all()
-
-            if not probe_logs:
-                logger.debug("No new readings to report")
-                self.last_report_time = datetime.utcnow()
-                return
-
-            # Group by MAC and average signal strength
-            readings_map: dict[str, list[int]] = {}
-            for log in probe_logs:
-                if log.signal_strength is None:
-                    continue
-
-                # Get MAC from asset
-                asset_stmt = select(Asset).where(Asset.id == log.asset_id)
-                asset_result = await session.execute(asset_stmt)
-                asset = asset_result.scalar_one_or_none()
-
-                if asset:
-                    mac = asset.mac_address
-                    if mac not in readings_map:
-                        readings_map[mac] = []
-                    readings_map[mac].append(log.signal_strength)
-
-            # Average signals per MAC
-            readings = []
-            for mac, signals in readings_map.items():
-                avg_signal = sum(signals) // len(signals)
-                readings.append({"mac_address": mac, "signal_strength": avg_signal})
-
-            if not readings:
-                logger.debug("No valid readings with signal strength")
-                self.last_report_time = datetime.utcnow()
-                return
-
-            # Batch readings if too many
-            if len(readings) > self.batch_size:
-                readings = readings[: self.batch_size]
-                logger.debug(f"Batching to {self.batch_size} readings")
+            stmt = (
+                select(Asset.mac_address, func.avg(ProbeLog.signal_strength))
+                .join(Asset, Asset.id == ProbeLog.asset_id)
+                .where(
+                    ProbeLog.timestamp >= cutoff_time,
+                    ProbeLog.signal_strength.is_not(None),
+                )
+                .group_by(Asset.mac_address)
+                .limit(self.batch_size)
+            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("DB pool: %s", self.engine.pool.status())
+            # Stream the rows rather than buffering the whole result
+            result = await session.stream(stmt)
+            readings = [
+                {"mac_address": mac, "signal_strength": math.floor(avg_signal)}
+                async for mac, avg_signal in result
+            ]
+
+        if not readings:
+            logger.debug("No new readings to report")
+            self.last_report_time = datetime.utcnow()
+            return
 
         # Send to primary
         payload = {"api_key": self.api_key, "readings": readings}
@@ -274,11 +402,12 @@ class SecondaryReporter:
         try:
             response = await self.http_client.post(
                 f"{self.primary_url}/api/monitors/report",
-                json=payload,
+                content=orjson.dumps(payload),
+                headers=JSON_HEADERS,
                 timeout=30.0,
             )
             response.raise_for_status()
-            result = response.json()
+            result = orjson.loads(response.content)
 
             self.total_readings_sent += len(readings)
             self.last_report_time = datetime.utcnow()
@@ -307,39 +436,41 @@ async def main_async(args):
 
     # Auto-discovery if not configured
     if not primary_url:
-        primary_url = discover_primary_monitor()
+        primary_url = await discover_primary_monitor()
         if not primary_url:
             logger.error("❌ Could not discover primary monitor")
             logger.error("Please specify --primary-url or set MANOMONITOR_PRIMARY_URL")
             return 1
 
-    if not api_key:
-        logger.info("🔑 Fetching API key from primary...")
-        api_key = await get_primary_api_key(primary_url)
+    async with create_http_client() as http_client:
         if not api_key:
-            logger.error("❌ Could not retrieve API key from primary")
-            logger.error("Please specify --api-key or set MANOMONITOR_API_KEY")
-            logger.error(f"Or run on primary: manomonitor monitor-info")
-            return 1
-
-    logger.info(f"✓ Configuration complete")
-    logger.info(f"  Primary: {primary_url}")
-    logger.info(f"  API Key: {api_key[:16]}...")
-
-    # Create and start reporter
-    reporter = SecondaryReporter(
-        primary_url=primary_url,
-        api_key=api_key,
-        report_interval=args.interval,
-        batch_size=args.batch_size,
-    )
+            logger.info("🔑 Fetching API key from primary...")
+            api_key = await get_primary_api_key(primary_url, http_client)
+            if not api_key:
+                logger.error("❌ Could not retrieve API key from primary")
+                logger.error("Please specify --api-key or set MANOMONITOR_API_KEY")
+                logger.error(f"Or run on primary: manomonitor monitor-info")
+                return 1
+
+        logger.info(f"✓ Configuration complete")
+        logger.info(f"  Primary: {primary_url}")
+        logger.info(f"  API Key: {api_key[:16]}...")
+
+        # Create and start reporter
+        reporter = SecondaryReporter(
+            primary_url=primary_url,
+            api_key=api_key,
+            report_interval=args.interval,
+            batch_size=args.batch_size,
+            http_client=http_client,
+        )
 
-    try:
-        await reporter.start()
-        return 0
-    except KeyboardInterrupt:
-        logger.info("Stopped by user")
-        return 0
+        try:
+            await reporter.start()
+            return 0
+        except KeyboardInterrupt:
+            logger.info("Stopped by user")
+            return 0
 
 
 def main():
@@ -0,0 +1,30 @@
+"""Fast JSON response classes for the API."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _default(obj: Any) -> Any:
+    """Fallback serializer for types orjson doesn't handle natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def json_dumps(content: Any) -> bytes:
+    """Serialize content to JSON bytes the same way ORJSONResponse does."""
+    return orjson.dumps(content, default=_default)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib json module."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
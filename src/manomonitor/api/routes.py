@@ -1,17 +1,28 @@
 """API routes for WhosHere."""
 
+import asyncio
+import json
 import logging
-from datetime import datetime
+import re
+import secrets
+import shutil
+from collections import defaultdict
+from datetime import datetime, timedelta
+from itertools import groupby
+from operator import attrgetter
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
+from sqlalchemy import desc, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from manomonitor.api.responses import ORJSONResponse, json_dumps
 from manomonitor.capture.monitor import get_capture
 from manomonitor.capture.network import get_arp_monitor, get_dhcp_monitor
 from manomonitor.config import settings
-from manomonitor.database.connection import get_db
+from manomonitor.database.connection import get_db, get_db_context
 from manomonitor.database.crud import (
     delete_asset,
     get_all_assets,
@@ -19,15 +30,35 @@ from manomonitor.database.crud import (
     get_asset_by_id,
     get_assets_count,
     get_config,
-    get_notification_logs,
-    get_probe_logs,
-    get_ssid_history,
+    get_local_monitor,
+    get_notification_log_rows,
+    get_probe_log_rows,
+    get_ssid_history_rows,
     get_statistics,
     purge_old_logs,
     set_config,
+    set_configs,
+    stream_assets,
     update_asset,
 )
+from manomonitor.database.heartbeats import get_monitor_heartbeats
+from manomonitor.database.models import Asset, Monitor, SignalReading
 from manomonitor.notifications import get_notification_manager
+from manomonitor.utils.cache import TTLCache
+from manomonitor.utils.geolocation import (
+    auto_detect_location,
+    clear_gps_device_cache,
+    find_gps_devices,
+    geolocate_via_google,
+    geolocate_via_gps,
+    geolocate_via_ip,
+)
+from manomonitor.utils.positioning import (
+    GeoPoint,
+    MonitorReading,
+    calculate_position,
+    signal_calibration,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -129,6 +160,28 @@ class NotificationLogResponse(BaseModel):
         from_attributes = True
 
 
+# Attributes exposed by the API for each ORM row type, in response field order
+ASSET_FIELDS = tuple(AssetResponse.model_fields)
+SSID_FIELDS = tuple(SSIDResponse.model_fields)
+PROBE_LOG_FIELDS = tuple(ProbeLogResponse.model_fields)
+NOTIFICATION_LOG_FIELDS = tuple(NotificationLogResponse.model_fields)
+
+
+def _project(row, fields: tuple[str, ...]) -> dict:
+    """Copy the given attributes of an ORM row into a dict."""
+    return {f: getattr(row, f) for f in fields}
+
+
+def _asset_to_dict(asset) -> dict:
+    """Project an Asset ORM row onto the AssetResponse fields."""
+    return _project(asset, ASSET_FIELDS)
+
+
+def _to_asset_response(asset) -> AssetResponse:
+    """Build an AssetResponse from an ORM row without re-validating it."""
+    return AssetResponse.model_construct(**_asset_to_dict(asset))
+
+
 class StatsResponse(BaseModel):
     """Response model for statistics."""
 
@@ -164,7 +217,11 @@ class MessageResponse(BaseModel):
 # =============================================================================
 
 
-@router.get("/assets", response_model=AssetListResponse)
+@router.get(
+    "/assets",
+    response_class=ORJSONResponse,
+    responses={200: {"model": AssetListResponse}},
+)
 async def list_assets(
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
@@ -174,46 +231,74 @@ async def list_assets(
     present_only: bool = Query(False),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get list of all tracked devices."""
-    assets = await get_all_assets(
-        db,
-        limit=limit,
-        offset=offset,
-        search=search,
-        include_hidden=include_hidden,
-        notify_only=notify_only,
-        present_only=present_only,
-    )
-    total = await get_assets_count(db, include_hidden=include_hidden, notify_only=notify_only)
-
-    return AssetListResponse(
-        items=[
-            AssetResponse(
-                id=a.id,
-                mac_address=a.mac_address,
-                nickname=a.nickname,
-                vendor=a.vendor,
-                device_type=a.device_type,
-                notify_enabled=a.notify_enabled,
-                signal_threshold=a.signal_threshold,
-                first_seen=a.first_seen,
-                last_seen=a.last_seen,
-                times_seen=a.times_seen,
-                last_signal_strength=a.last_signal_strength,
-                last_notified=a.last_notified,
-                notes=a.notes,
-                is_hidden=a.is_hidden,
-                is_present=a.is_present,
-                minutes_since_seen=a.minutes_since_seen,
-                display_name=a.display_name,
+    """
+    Get list of all tracked devices.
+
+    Returns the AssetListResponse shape, but serializes the ORM rows directly
+    with orjson rather than building and re-validating a Pydantic model per row.
+    """
+    # The page and the total are independent queries; an AsyncSession can only
+    # run one statement at a time, so count on a second session concurrently.
+    async def _count() -> int:
+        async with get_db_context() as count_db:
+            return await get_assets_count(
+                count_db, include_hidden=include_hidden, notify_only=notify_only
             )
-            for a in assets
-        ],
-        total=total,
-        limit=limit,
-        offset=offset,
+
+    assets, total = await asyncio.gather(
+        get_all_assets(
+            db,
+            limit=limit,
+            offset=offset,
+            search=search,
+            include_hidden=include_hidden,
+            notify_only=notify_only,
+            present_only=present_only,
+        ),
+        _count(),
     )
 
+    return ORJSONResponse({
+        "items": [_asset_to_dict(a) for a in assets],
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+    })
+
+
+@router.get("/assets.ndjson")
+async def stream_assets_ndjson(
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    search: Optional[str] = Query(None),
+    include_hidden: bool = Query(False),
+    notify_only: bool = Query(False),
+    present_only: bool = Query(False),
+):
+    """
+    Stream tracked devices as newline-delimited JSON, one AssetResponse per line.
+
+    Rows are serialized as they are fetched, so large pages never have to be
+    held in memory at once.
+    """
+
+    async def _lines():
+        # The request-scoped session is closed before the body is streamed,
+        # so the generator owns its own.
+        async with get_db_context() as db:
+            async for asset in stream_assets(
+                db,
+                limit=limit,
+                offset=offset,
+                search=search,
+                include_hidden=include_hidden,
+                notify_only=notify_only,
+                present_only=present_only,
+            ):
+                yield json_dumps(_asset_to_dict(asset)) + b"\n"
+
+    return StreamingResponse(_lines(), media_type="application/x-ndjson")
+
 
 @router.get("/assets/{asset_id}", response_model=AssetResponse)
 async def get_asset(
@@ -225,28 +310,7 @@ async def get_asset(
     if not asset:
         raise HTTPException(status_code=404, detail="Asset not found")
 
-    return AssetResponse(
-        id=asset.id,
-        mac_address=asset.mac_address,
-        nickname=asset.nickname,
-        vendor=asset.vendor,
-        device_type=asset.device_type,
-        notify_enabled=asset.notify_enabled,
-        signal_threshold=asset.signal_threshold,
-        first_seen=asset.first_seen,
-        last_seen=asset.last_seen,
-        times_seen=asset.times_seen,
-        last_signal_strength=asset.last_signal_strength,
-        last_notified=asset.last_notified,
-        notes=asset.notes,
-        is_hidden=asset.is_hidden,
-        is_present=asset.is_present,
-        minutes_since_seen=asset.minutes_since_seen,
-        display_name=asset.display_name,
-        vendor_display=asset.vendor_display,
-        device_type_display=asset.device_type_display,
-        device_icon=asset.device_icon,
-    )
+    return _to_asset_response(asset)
 
 
 @router.patch("/assets/{asset_id}", response_model=AssetResponse)
@@ -270,28 +334,8 @@ async def update_asset_endpoint(
     if not asset:
         raise HTTPException(status_code=404, detail="Asset not found")
 
-    return AssetResponse(
-        id=asset.id,
-        mac_address=asset.mac_address,
-        nickname=asset.nickname,
-        vendor=asset.vendor,
-        device_type=asset.device_type,
-        notify_enabled=asset.notify_enabled,
-        signal_threshold=asset.signal_threshold,
-        first_seen=asset.first_seen,
-        last_seen=asset.last_seen,
-        times_seen=asset.times_seen,
-        last_signal_strength=asset.last_signal_strength,
-        last_notified=asset.last_notified,
-        notes=asset.notes,
-        is_hidden=asset.is_hidden,
-        is_present=asset.is_present,
-        minutes_since_seen=asset.minutes_since_seen,
-        display_name=asset.display_name,
-        vendor_display=asset.vendor_display,
-        device_type_display=asset.device_type_display,
-        device_icon=asset.device_icon,
-    )
+    _map_cache.clear()
+    return _to_asset_response(asset)
 
 
 @router.delete("/assets/{asset_id}", response_model=MessageResponse)
@@ -303,11 +347,16 @@ async def delete_asset_endpoint(
     success = await delete_asset(db, asset_id)
     if not success:
         raise HTTPException(status_code=404, detail="Asset not found")
+    _map_cache.clear()
 
     return MessageResponse(message="Asset deleted successfully")
 
 
-@router.get("/assets/{asset_id}/ssids", response_model=list[SSIDResponse])
+@router.get(
+    "/assets/{asset_id}/ssids",
+    response_class=ORJSONResponse,
+    responses={200: {"model": list[SSIDResponse]}},
+)
 async def get_asset_ssids(
     asset_id: int,
     db: AsyncSession = Depends(get_db),
@@ -317,11 +366,15 @@ async def get_asset_ssids(
     if not asset:
         raise HTTPException(status_code=404, detail="Asset not found")
 
-    ssids = await get_ssid_history(db, asset_id)
-    return [SSIDResponse.model_validate(s) for s in ssids]
+    ssids = await get_ssid_history_rows(db, asset_id, columns=SSID_FIELDS)
+    return ORJSONResponse(ssids)
 
 
-@router.get("/assets/{asset_id}/logs", response_model=list[ProbeLogResponse])
+@router.get(
+    "/assets/{asset_id}/logs",
+    response_class=ORJSONResponse,
+    responses={200: {"model": list[ProbeLogResponse]}},
+)
 async def get_asset_logs(
     asset_id: int,
     limit: int = Query(100, ge=1, le=1000),
@@ -332,8 +385,8 @@ async def get_asset_logs(
     if not asset:
         raise HTTPException(status_code=404, detail="Asset not found")
 
-    logs = await get_probe_logs(db, asset_id=asset_id, limit=limit)
-    return [ProbeLogResponse.model_validate(log) for log in logs]
+    logs = await get_probe_log_rows(db, PROBE_LOG_FIELDS, asset_id=asset_id, limit=limit)
+    return ORJSONResponse(logs)
 
 
 # =============================================================================
@@ -348,30 +401,45 @@ async def get_stats(db: AsyncSession = Depends(get_db)):
     return StatsResponse(**stats)
 
 
+def _mask_db_url(db_url: str) -> str:
+    """Hide the password in a database connection string."""
+    if "@" in db_url:
+        parts = db_url.split("@")
+        prefix = parts[0].rsplit(":", 1)[0]
+        db_url = f"{prefix}:***@{parts[1]}"
+    return db_url
+
+
+# The database URL is fixed for the life of the process
+_MASKED_DB_URL = _mask_db_url(settings.database_url)
+
+# Status and diagnostics are polled by dashboards but only change on
+# start/stop, so serve them from a short-lived cache.
+_status_cache = TTLCache(ttl=2.0)
+_diagnostics_cache = TTLCache(ttl=5.0)
+
+
 @router.get("/status", response_model=StatusResponse)
 async def get_status():
     """Get system status."""
+    return await _status_cache.get_or_set("status", _build_status)
+
+
+async def _build_status() -> StatusResponse:
+    """Collect the current system status."""
     capture = get_capture()
     manager = get_notification_manager()
     arp_monitor = get_arp_monitor()
     dhcp_monitor = get_dhcp_monitor()
 
-    # Mask database URL password if present
-    db_url = settings.database_url
-    if "@" in db_url:
-        # Hide password in connection string
-        parts = db_url.split("@")
-        prefix = parts[0].rsplit(":", 1)[0]
-        db_url = f"{prefix}:***@{parts[1]}"
-
     return StatusResponse(
         capture_running=capture.is_running,
         arp_monitoring_running=arp_monitor.is_running,
         dhcp_monitoring_running=dhcp_monitor.is_running,
         notifications_running=manager.is_running,
         wifi_interface=settings.wifi_interface,
-        database_url=db_url,
-        notifiers_configured=[n.name for n in manager.notifiers],
+        database_url=_MASKED_DB_URL,
+        notifiers_configured=manager.notifier_names,
         dhcp_lease_file=dhcp_monitor.lease_file,
     )
 
@@ -405,10 +473,11 @@ async def get_diagnostics():
     - If tshark is available for WiFi capture
     - WiFi interface status
     """
-    import asyncio
-    import shutil
-    import subprocess
+    return await _diagnostics_cache.get_or_set("diagnostics", _run_diagnostics)
+
 
+async def _run_diagnostics() -> DiagnosticsResponse:
+    """Run the diagnostics checks."""
     arp_monitor = get_arp_monitor()
     dhcp_monitor = get_dhcp_monitor()
     capture = get_capture()
@@ -429,12 +498,10 @@ async def get_diagnostics():
     # Get ARP table entries
     if ok:
         try:
-            entries = await arp_monitor._get_arp_table()
-            result.arp_table_entries = len(entries)
-            # Show first 5 entries as sample
-            result.arp_sample_entries = [
-                {"ip": ip, "mac": mac} for ip, mac in entries[:5]
-            ]
+            # Count entries and keep the first 5 as a sample
+            count, sample = await arp_monitor._get_arp_sample(5)
+            result.arp_table_entries = count
+            result.arp_sample_entries = [{"ip": ip, "mac": mac} for ip, mac in sample]
         except Exception as e:
             result.arp_error = str(e)
 
@@ -456,8 +523,8 @@ async def get_diagnostics():
     result.wifi_interface_info = msg
 
     # Get known MAC counts
-    result.known_arp_macs = len(arp_monitor._known_macs)
-    result.known_dhcp_macs = len(dhcp_monitor._known_macs)
+    result.known_arp_macs = len(arp_monitor._last_stored)
+    result.known_dhcp_macs = len(dhcp_monitor._last_stored)
 
     return result
 
@@ -467,15 +534,21 @@ async def get_diagnostics():
 # =============================================================================
 
 
-@router.get("/notifications/logs", response_model=list[NotificationLogResponse])
+@router.get(
+    "/notifications/logs",
+    response_class=ORJSONResponse,
+    responses={200: {"model": list[NotificationLogResponse]}},
+)
 async def get_notifications(
     limit: int = Query(50, ge=1, le=200),
     asset_id: Optional[int] = Query(None),
     db: AsyncSession = Depends(get_db),
 ):
     """Get notification history."""
-    logs = await get_notification_logs(db, limit=limit, asset_id=asset_id)
-    return [NotificationLogResponse.model_validate(log) for log in logs]
+    logs = await get_notification_log_rows(
+        db, NOTIFICATION_LOG_FIELDS, limit=limit, asset_id=asset_id
+    )
+    return ORJSONResponse(logs)
 
 
 @router.post("/notifications/test", response_model=MessageResponse)
@@ -522,6 +595,7 @@ async def start_capture():
 
     try:
         await capture.start()
+        _status_cache.clear()
         return MessageResponse(message="Capture started")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -535,6 +609,7 @@ async def stop_capture():
         return MessageResponse(message="Capture not running")
 
     await capture.stop()
+    _status_cache.clear()
     return MessageResponse(message="Capture stopped")
 
 
@@ -568,6 +643,20 @@ class MonitorResponse(BaseModel):
         from_attributes = True
 
 
+MONITOR_FIELDS = tuple(MonitorResponse.model_fields)
+
+
+# Serialized /map/data payload. Browsers poll it, and it only changes when
+# monitors, readings or devices change (or presence ages out), so keep it
+# briefly and drop it whenever one of those is written through the API.
+_map_cache = TTLCache(ttl=2.0)
+
+# Reported MACs are uppercased with a translate table (hex digits only) and
+# must then be colon-separated, e.g. "AA:BB:CC:DD:EE:FF".
+_MAC_UPPER = str.maketrans("abcdef", "ABCDEF")
+_MAC_PATTERN = re.compile(r"[0-9A-F]{2}(?::[0-9A-F]{2}){5}")
+
+
 class MonitorRegisterRequest(BaseModel):
     """Request to register a new monitor."""
     name: str = Field(..., max_length=100)
@@ -606,30 +695,19 @@ class MapDataResponse(BaseModel):
     map_enabled: bool
 
 
-@router.get("/monitors", response_model=list[MonitorResponse])
+@router.get(
+    "/monitors",
+    response_class=ORJSONResponse,
+    responses={200: {"model": list[MonitorResponse]}},
+)
 async def list_monitors(
     db: AsyncSession = Depends(get_db),
 ):
     """Get list of all monitors."""
-    from sqlalchemy import select
-    from manomonitor.database.models import Monitor
-
     result = await db.execute(select(Monitor).where(Monitor.is_active == True))
     monitors = result.scalars().all()
 
-    return [
-        MonitorResponse(
-            id=m.id,
-            name=m.name,
-            latitude=m.latitude,
-            longitude=m.longitude,
-            is_active=m.is_active,
-            is_local=m.is_local,
-            is_online=m.is_online,
-            last_seen=m.last_seen,
-        )
-        for m in monitors
-    ]
+    return ORJSONResponse([_project(m, MONITOR_FIELDS) for m in monitors])
 
 
 @router.get("/monitors/local-api-key")
@@ -637,11 +715,7 @@ async def get_local_monitor_api_key(
     db: AsyncSession = Depends(get_db),
 ):
     """Get the API key for the local monitor (for secondary monitor setup)."""
-    from sqlalchemy import select
-    from manomonitor.database.models import Monitor
-
-    result = await db.execute(select(Monitor).where(Monitor.is_local == True))
-    local_monitor = result.scalar_one_or_none()
+    local_monitor = await get_local_monitor(db)
 
     if not local_monitor or not local_monitor.api_key:
         raise HTTPException(
@@ -663,11 +737,8 @@ async def register_monitor(
     db: AsyncSession = Depends(get_db),
 ):
     """Register a new monitor or update existing."""
-    import secrets
-    from sqlalchemy import select
-    from manomonitor.database.models import Monitor
-
     api_key = data.api_key or secrets.token_hex(32)
+    now = datetime.utcnow()
 
     # Check if monitor with this API key exists
     result = await db.execute(select(Monitor).where(Monitor.api_key == api_key))
@@ -678,7 +749,7 @@ async def register_monitor(
         monitor.name = data.name
         monitor.latitude = data.latitude
         monitor.longitude = data.longitude
-        monitor.last_seen = datetime.utcnow()
+        monitor.last_seen = now
     else:
         # Create new
         monitor = Monitor(
@@ -688,11 +759,12 @@ async def register_monitor(
             longitude=data.longitude,
             is_active=True,
             is_local=False,
-            last_seen=datetime.utcnow(),
+            last_seen=now,
         )
         db.add(monitor)
 
     await db.flush()
+    _map_cache.clear()
 
     return MonitorResponse(
         id=monitor.id,
@@ -712,10 +784,6 @@ async def report_signals(
     db: AsyncSession = Depends(get_db),
 ):
     """Report signal readings from a remote monitor."""
-    from sqlalchemy import select
-    from manomonitor.database.models import Monitor, SignalReading, Asset
-    from manomonitor.utils.positioning import signal_to_distance
-
     # Validate API key
     result = await db.execute(select(Monitor).where(Monitor.api_key == data.api_key))
     monitor = result.scalar_one_or_none()
@@ -723,138 +791,161 @@ async def report_signals(
     if not monitor:
         raise HTTPException(status_code=401, detail="Invalid API key")
 
-    # Update monitor last seen
-    monitor.last_seen = datetime.utcnow()
+    # One timestamp and distance calibration for the whole report
+    now = datetime.utcnow()
+    calibration = signal_calibration(settings.signal_tx_power, settings.signal_path_loss)
+
+    # Update monitor last seen (written in batches in the background)
+    get_monitor_heartbeats().touch(monitor.id, now)
 
-    readings_added = 0
+    valid_readings: list[tuple[str, int]] = []
     for reading in data.readings:
-        mac = reading.get("mac_address", "").upper()
+        mac = reading.get("mac_address", "").translate(_MAC_UPPER)
         signal = reading.get("signal_strength")
 
-        if not mac or signal is None:
+        if signal is None or not _MAC_PATTERN.fullmatch(mac):
             continue
+        valid_readings.append((mac, signal))
 
-        # Find or create asset
-        result = await db.execute(select(Asset).where(Asset.mac_address == mac))
-        asset = result.scalar_one_or_none()
-
-        if not asset:
-            # Create basic asset entry
-            asset = Asset(mac_address=mac)
-            db.add(asset)
-            await db.flush()
-
-        # Add signal reading
-        distance = signal_to_distance(
-            signal,
-            tx_power=settings.signal_tx_power,
-            path_loss_exponent=settings.signal_path_loss,
-        )
+    if not valid_readings:
+        return MessageResponse(message="Recorded 0 signal readings")
 
-        sr = SignalReading(
-            asset_id=asset.id,
-            monitor_id=monitor.id,
-            signal_strength=signal,
-            estimated_distance=distance,
-            timestamp=datetime.utcnow(),
-        )
-        db.add(sr)
-        readings_added += 1
+    # Resolve all reported MACs to asset IDs in one query
+    macs = dict.fromkeys(mac for mac, _ in valid_readings)
+    result = await db.execute(
+        select(Asset.id, Asset.mac_address).where(Asset.mac_address.in_(macs))
+    )
+    mac_to_id = {mac: asset_id for asset_id, mac in result.all()}
+
+    # Create basic asset entries for unknown MACs
+    new_assets = [Asset(mac_address=mac) for mac in macs if mac not in mac_to_id]
+    if new_assets:
+        db.add_all(new_assets)
+        await db.flush()
+        mac_to_id.update((asset.mac_address, asset.id) for asset in new_assets)
+
+    # Add signal readings in a single bulk INSERT (no ORM objects needed)
+    await db.execute(
+        insert(SignalReading),
+        [
+            {
+                "asset_id": mac_to_id[mac],
+                "monitor_id": monitor.id,
+                "signal_strength": signal,
+                "estimated_distance": calibration.distance(signal),
+                "timestamp": now,
+            }
+            for mac, signal in valid_readings
+        ],
+    )
+    readings_added = len(valid_readings)
+    _map_cache.clear()
 
     return MessageResponse(message=f"Recorded {readings_added} signal readings")
 
 
-@router.get("/map/data", response_model=MapDataResponse)
+@router.get(
+    "/map/data",
+    response_class=ORJSONResponse,
+    responses={200: {"model": MapDataResponse}},
+)
 async def get_map_data(
     db: AsyncSession = Depends(get_db),
 ):
     """Get all data needed for the device location map."""
-    from sqlalchemy import select, desc
-    from manomonitor.database.models import Monitor, Asset, SignalReading
-    from manomonitor.utils.positioning import (
-        GeoPoint, MonitorReading, calculate_position, signal_to_distance
-    )
 
+    async def _render() -> bytes:
+        return ORJSONResponse(await _build_map_data(db)).body
+
+    body = await _map_cache.get_or_set("map", _render)
+    return Response(content=body, media_type="application/json")
+
+
+async def _build_map_data(db: AsyncSession) -> dict:
+    """Position devices from recent signal readings and build the map payload."""
     # Get all active monitors
     result = await db.execute(select(Monitor).where(Monitor.is_active == True))
     monitors = result.scalars().all()
 
-    monitor_responses = [
-        MonitorResponse(
-            id=m.id,
-            name=m.name,
-            latitude=m.latitude,
-            longitude=m.longitude,
-            is_active=m.is_active,
-            is_local=m.is_local,
-            is_online=m.is_online,
-            last_seen=m.last_seen,
-        )
-        for m in monitors
-    ]
-
-    # Build monitor lookup
-    monitor_lookup = {m.id: m for m in monitors}
+    # Without a monitor there is nothing to position devices against
+    if not monitors:
+        if settings.monitor_latitude != 0:
+            center_lat = settings.monitor_latitude
+            center_lon = settings.monitor_longitude
+        else:
+            center_lat = 0.0
+            center_lon = 0.0
+        return {
+            "monitors": [],
+            "devices": [],
+            "center_lat": center_lat,
+            "center_lon": center_lon,
+            "map_enabled": settings.map_enabled,
+        }
+
+    monitor_responses = [_project(m, MONITOR_FIELDS) for m in monitors]
+
+    # Build monitor location lookup
+    monitor_lookup = {m.id: GeoPoint(m.latitude, m.longitude) for m in monitors}
+
+    # Calculate map center (also the preferred side for bilateration)
+    center_lat = sum(m.latitude for m in monitors) / len(monitors)
+    center_lon = sum(m.longitude for m in monitors) / len(monitors)
+    home_center = GeoPoint(center_lat, center_lon)
 
     # Get present devices with their recent signal readings
     assets = await get_all_assets(db, limit=100, present_only=False, include_hidden=False)
 
-    device_positions: list[DevicePositionResponse] = []
+    # Loop invariants
+    now = datetime.utcnow()
+    calibration = signal_calibration(settings.signal_tx_power, settings.signal_path_loss)
+    window = settings.signal_averaging_window
+
+    # Get recent signal readings (last 5 minutes) for all assets in one query
+    cutoff = now - timedelta(minutes=5)
+    result = await db.execute(
+        select(SignalReading)
+        .where(SignalReading.asset_id.in_([a.id for a in assets]))
+        .where(SignalReading.timestamp >= cutoff)
+        .order_by(SignalReading.asset_id, desc(SignalReading.timestamp))
+    )
+    readings_by_asset: dict[int, list[SignalReading]] = {
+        asset_id: list(group)
+        for asset_id, group in groupby(result.scalars().all(), key=attrgetter("asset_id"))
+    }
+
+    device_positions: list[dict] = []
 
     for asset in assets:
-        # Get recent signal readings for this asset (last 5 minutes)
-        from datetime import timedelta
-        cutoff = datetime.utcnow() - timedelta(minutes=5)
-
-        result = await db.execute(
-            select(SignalReading)
-            .where(SignalReading.asset_id == asset.id)
-            .where(SignalReading.timestamp >= cutoff)
-            .order_by(desc(SignalReading.timestamp))
-        )
-        readings = result.scalars().all()
+        readings = readings_by_asset.get(asset.id, [])
 
         # Build position from readings
         lat, lon, accuracy = None, None, None
 
-        if readings and len(monitor_lookup) > 0:
-            # Group by monitor and collect readings for averaging
-            monitor_readings: dict[int, list[SignalReading]] = {}
+        if readings:
+            # Group by monitor, keeping the newest averaging_window readings each
+            monitor_readings: defaultdict[int, list[SignalReading]] = defaultdict(list)
             for r in readings:
-                if r.monitor_id not in monitor_readings:
-                    monitor_readings[r.monitor_id] = []
-                # Collect up to averaging_window readings per monitor
-                if len(monitor_readings[r.monitor_id]) < settings.signal_averaging_window:
-                    monitor_readings[r.monitor_id].append(r)
+                group = monitor_readings[r.monitor_id]
+                if len(group) < window:
+                    group.append(r)
 
             # Convert to MonitorReading objects with averaged signals
             position_readings = []
             for mid, readings_list in monitor_readings.items():
-                if mid in monitor_lookup and readings_list:
-                    m = monitor_lookup[mid]
+                if mid in monitor_lookup:
                     # Average the signal strengths
                     avg_signal = sum(r.signal_strength for r in readings_list) // len(readings_list)
                     # Recalculate distance from averaged signal
-                    avg_distance = signal_to_distance(
-                        avg_signal,
-                        settings.signal_tx_power,
-                        settings.signal_path_loss,
-                    )
+                    avg_distance = calibration.distance(avg_signal)
                     position_readings.append(MonitorReading(
-                        monitor_location=GeoPoint(m.latitude, m.longitude),
+                        monitor_location=monitor_lookup[mid],
                         signal_strength=avg_signal,
                         estimated_distance=avg_distance,
                     ))
 
             if len(position_readings) >= 2:
-                # Calculate center for preference
-                center_lat = sum(m.latitude for m in monitors) / len(monitors)
-                center_lon = sum(m.longitude for m in monitors) / len(monitors)
-
-                estimate = calculate_position(
-                    position_readings,
-                    home_center=GeoPoint(center_lat, center_lon),
-                )
+                estimate = calculate_position(position_readings, home_center=home_center)
                 if estimate:
                     lat = estimate.location.latitude
                     lon = estimate.location.longitude
@@ -864,19 +955,14 @@ async def get_map_data(
                     asset.last_latitude = lat
                     asset.last_longitude = lon
                     asset.position_accuracy = accuracy
-                    asset.position_updated_at = datetime.utcnow()
+                    asset.position_updated_at = now
 
             elif len(position_readings) == 1:
                 # Single monitor - use monitor location with distance ring
-                m = monitors[0] if monitors else None
-                if m:
-                    lat = m.latitude
-                    lon = m.longitude
-                    accuracy = signal_to_distance(
-                        position_readings[0].signal_strength,
-                        settings.signal_tx_power,
-                        settings.signal_path_loss,
-                    )
+                m = monitors[0]
+                lat = m.latitude
+                lon = m.longitude
+                accuracy = calibration.distance(position_readings[0].signal_strength)
 
         # Use stored position if no recent readings
         if lat is None and asset.last_latitude is not None:
@@ -886,52 +972,37 @@ async def get_map_data(
 
         # Fallback for present devices with no signal readings:
         # Place at monitor location so they still appear on map
-        if lat is None and asset.is_present and monitors:
+        if lat is None and asset.is_present:
             m = monitors[0]
             lat = m.latitude
             lon = m.longitude
             # Use last signal strength to estimate distance, or default
             if asset.last_signal_strength:
-                accuracy = signal_to_distance(
-                    asset.last_signal_strength,
-                    settings.signal_tx_power,
-                    settings.signal_path_loss,
-                )
+                accuracy = calibration.distance(asset.last_signal_strength)
             else:
                 accuracy = 10.0  # Default 10m accuracy
 
-        device_positions.append(DevicePositionResponse(
-            id=asset.id,
-            mac_address=asset.mac_address,
-            display_name=asset.display_name,
-            device_icon=asset.device_icon,
-            device_type=asset.device_type,
-            latitude=lat,
-            longitude=lon,
-            accuracy=accuracy,
-            signal_strength=asset.last_signal_strength,
-            is_present=asset.is_present,
-            last_seen_minutes=asset.minutes_since_seen,
-        ))
-
-    # Calculate map center
-    if monitors:
-        center_lat = sum(m.latitude for m in monitors) / len(monitors)
-        center_lon = sum(m.longitude for m in monitors) / len(monitors)
-    elif settings.monitor_latitude != 0:
-        center_lat = settings.monitor_latitude
-        center_lon = settings.monitor_longitude
-    else:
-        center_lat = 0.0
-        center_lon = 0.0
-
-    return MapDataResponse(
-        monitors=monitor_responses,
-        devices=device_positions,
-        center_lat=center_lat,
-        center_lon=center_lon,
-        map_enabled=settings.map_enabled,
-    )
+        device_positions.append({
+            "id": asset.id,
+            "mac_address": asset.mac_address,
+            "display_name": asset.display_name,
+            "device_icon": asset.device_icon,
+            "device_type": asset.device_type,
+            "latitude": lat,
+            "longitude": lon,
+            "accuracy": accuracy,
+            "signal_strength": asset.last_signal_strength,
+            "is_present": asset.is_present,
+            "last_seen_minutes": asset.minutes_since_seen,
+        })
+
+    return {
+        "monitors": monitor_responses,
+        "devices": device_positions,
+        "center_lat": center_lat,
+        "center_lon": center_lon,
+        "map_enabled": settings.map_enabled,
+    }
 
 
 # =============================================================================
@@ -948,8 +1019,73 @@ class LocationDetectResponse(BaseModel):
     message: str
 
 
-@router.post("/monitors/auto-detect-location", response_model=LocationDetectResponse)
+# GPS/WiFi/IP lookups take seconds and hit rate-limited external APIs, while
+# the monitor rarely moves. Reuse a fix for a day, and persist the last one in
+# the config table so restarts don't have to detect again. Cache entries are
+# (detected_at, location) so a fix restored from the config table still
+# expires a day after it was detected, not a day after the restart.
+_LOCATION_TTL_SECONDS = 24 * 60 * 60
+_LOCATION_CONFIG_KEY = "last_detected_location"
+_location_cache = TTLCache(ttl=_LOCATION_TTL_SECONDS)
+
+
+def _location_expired(detected_at: datetime) -> bool:
+    """Whether a fix detected at detected_at is too old to reuse."""
+    return (datetime.utcnow() - detected_at).total_seconds() >= _LOCATION_TTL_SECONDS
+
+
+def _location_cache_key() -> tuple:
+    """Identify the detection sources a cached fix was obtained with."""
+    return (
+        settings.gps_enabled,
+        settings.gps_device,
+        settings.wifi_interface,
+        bool(settings.google_geolocation_api_key),
+    )
+
+
+async def _load_saved_location(
+    db: AsyncSession, key: tuple
+) -> Optional[tuple[datetime, LocationDetectResponse]]:
+    """Return the persisted (detected_at, fix) if recent and from the same sources."""
+    raw = await get_config(db, _LOCATION_CONFIG_KEY)
+    if not raw:
+        return None
+    try:
+        saved = json.loads(raw)
+        detected_at = datetime.fromisoformat(saved["detected_at"])
+        if tuple(saved["key"]) != key:
+            return None
+        if _location_expired(detected_at):
+            return None
+        return detected_at, LocationDetectResponse(**saved["location"])
+    except (ValueError, TypeError, KeyError):
+        return None
+
+
+async def _save_location(
+    db: AsyncSession, key: tuple, detected_at: datetime, location: LocationDetectResponse
+) -> None:
+    """Persist a detected fix so it survives restarts."""
+    await set_config(
+        db,
+        _LOCATION_CONFIG_KEY,
+        json.dumps({
+            "key": list(key),
+            "detected_at": detected_at.isoformat(),
+            "location": location.model_dump(),
+        }),
+        description="Last auto-detected monitor location",
+    )
+
+
+@router.post(
+    "/monitors/auto-detect-location",
+    response_class=ORJSONResponse,
+    responses={200: {"model": LocationDetectResponse}},
+)
 async def auto_detect_monitor_location(
+    force: bool = Query(default=False, description="Ignore any cached location and detect again"),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -960,58 +1096,122 @@ async def auto_detect_monitor_location(
     2. Google Geolocation API (WiFi-based, ~10-50m accuracy) - requires API key
     3. IP Geolocation (fallback, ~5km accuracy) - no key required
 
-    The detected location can be used to set up the local monitor.
+    A successful fix is reused for 24 hours (also across restarts) unless
+    force=true. The detected location can be used to set up the local monitor.
     """
-    from manomonitor.utils.geolocation import (
-        auto_detect_location,
-        find_gps_devices,
-        geolocate_via_gps,
-        geolocate_via_ip,
+    key = _location_cache_key()
+
+    async def _detect() -> tuple[datetime, LocationDetectResponse]:
+        if not force:
+            saved = await _load_saved_location(db, key)
+            if saved:
+                return saved
+        location = await _detect_location()
+        detected_at = datetime.utcnow()
+        await _save_location(db, key, detected_at, location)
+        return detected_at, location
+
+    if force:
+        clear_gps_device_cache()
+        entry = await _detect()
+        _location_cache.set(key, entry)
+    else:
+        entry = _location_cache.get(key)
+        if entry is not None and _location_expired(entry[0]):
+            _location_cache.invalidate(key)
+        entry = await _location_cache.get_or_set(key, _detect)
+    location = entry[1]
+
+    return ORJSONResponse(location.model_dump())
+
+
+# Overall time allowed for the GPS/WiFi/IP race in _detect_location
+_LOCATION_DETECT_BUDGET_SECONDS = 20.0
+
+
+def _location_response(method: str, location) -> LocationDetectResponse:
+    """Wrap a detected GeoLocation with a method-specific message."""
+    if method == "gps":
+        message = f"Location detected via GPS (accuracy: ~{location.accuracy:.1f}m)"
+    elif method == "wifi":
+        message = f"Location detected via WiFi (accuracy: ~{int(location.accuracy)}m)"
+    else:
+        message = f"Location detected via IP address (city-level, ~{int(location.accuracy/1000)}km accuracy). For better accuracy, connect a USB GPS dongle."
+
+    return LocationDetectResponse(
+        latitude=location.latitude,
+        longitude=location.longitude,
+        accuracy=location.accuracy,
+        method=method,
+        message=message,
     )
 
-    # Try GPS first (most accurate)
-    if settings.gps_enabled:
-        gps_devices = find_gps_devices()
-        if gps_devices or settings.gps_device:
-            location = await geolocate_via_gps(
-                settings.gps_device or None,
-                timeout=15.0,
-            )
-            if location:
-                return LocationDetectResponse(
-                    latitude=location.latitude,
-                    longitude=location.longitude,
-                    accuracy=location.accuracy,
-                    method="gps",
-                    message=f"Location detected via GPS (accuracy: ~{location.accuracy:.1f}m)",
-                )
-
-    # Try WiFi geolocation
+
+def _finished_location(method: str, task: asyncio.Task):
+    """Result of a finished detection task, or None if it failed."""
+    if task.cancelled():
+        return None
+    if task.exception() is not None:
+        logger.warning(f"Location detection via {method} failed: {task.exception()}")
+        return None
+    return task.result()
+
+
+async def _detect_location() -> LocationDetectResponse:
+    """
+    Detect location via GPS, WiFi and IP concurrently.
+
+    All available methods start at once. A result is used as soon as every
+    more accurate method has finished without one (GPS > WiFi > IP), so a
+    slow or absent GPS no longer delays the fallbacks. If the budget runs out,
+    the best result obtained so far is used.
+    """
+    # Insertion order is priority order
+    attempts: dict[str, asyncio.Task] = {}
+    if settings.gps_enabled and (find_gps_devices() or settings.gps_device):
+        attempts["gps"] = asyncio.create_task(
+            geolocate_via_gps(settings.gps_device or None, timeout=15.0)
+        )
     if settings.google_geolocation_api_key:
-        from manomonitor.utils.geolocation import geolocate_via_google
-        location = await geolocate_via_google(
-            settings.google_geolocation_api_key,
-            interface=settings.wifi_interface,
+        attempts["wifi"] = asyncio.create_task(
+            geolocate_via_google(
+                settings.google_geolocation_api_key,
+                interface=settings.wifi_interface,
+            )
         )
-        if location:
-            return LocationDetectResponse(
-                latitude=location.latitude,
-                longitude=location.longitude,
-                accuracy=location.accuracy,
-                method="wifi",
-                message=f"Location detected via WiFi (accuracy: ~{int(location.accuracy)}m)",
+    attempts["ip"] = asyncio.create_task(geolocate_via_ip())
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + _LOCATION_DETECT_BUDGET_SECONDS
+
+    try:
+        while True:
+            for method, task in attempts.items():
+                if not task.done():
+                    break  # A more accurate method may still succeed
+                location = _finished_location(method, task)
+                if location:
+                    return _location_response(method, location)
+            else:
+                break  # Everything finished without a fix
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            pending = [task for task in attempts.values() if not task.done()]
+            await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
             )
 
-    # Fallback to IP geolocation
-    location = await geolocate_via_ip()
-    if location:
-        return LocationDetectResponse(
-            latitude=location.latitude,
-            longitude=location.longitude,
-            accuracy=location.accuracy,
-            method="ip",
-            message=f"Location detected via IP address (city-level, ~{int(location.accuracy/1000)}km accuracy). For better accuracy, connect a USB GPS dongle.",
-        )
+        # Out of time: settle for the best method that did finish
+        for method, task in attempts.items():
+            if task.done():
+                location = _finished_location(method, task)
+                if location:
+                    return _location_response(method, location)
+    finally:
+        for task in attempts.values():
+            task.cancel()
 
     raise HTTPException(
         status_code=500,
@@ -1032,17 +1232,14 @@ async def setup_local_monitor(
     2. Falls back to auto-detection if enabled
     3. Creates/updates the local monitor in the database
     """
-    import secrets
-    from sqlalchemy import select
-    from manomonitor.database.models import Monitor
-
     lat = settings.monitor_latitude
     lon = settings.monitor_longitude
     method = "configured"
 
     # If not configured, try auto-detection
     if (lat == 0.0 and lon == 0.0) and auto_detect:
-        from manomonitor.utils.geolocation import auto_detect_location
+        # Setup is run when hardware changes; look for GPS devices afresh
+        clear_gps_device_cache()
 
         location = await auto_detect_location(
             google_api_key=settings.google_geolocation_api_key or None,
@@ -1068,10 +1265,10 @@ async def setup_local_monitor(
 
     # Get or create API key
     api_key = settings.monitor_api_key or secrets.token_hex(32)
+    now = datetime.utcnow()
 
     # Check for existing local monitor
-    result = await db.execute(select(Monitor).where(Monitor.is_local == True))
-    monitor = result.scalar_one_or_none()
+    monitor = await get_local_monitor(db)
 
     if monitor:
         # Update existing
@@ -1079,7 +1276,7 @@ async def setup_local_monitor(
         monitor.latitude = lat
         monitor.longitude = lon
         monitor.api_key = api_key
-        monitor.last_seen = datetime.utcnow()
+        monitor.last_seen = now
     else:
         # Create new local monitor
         monitor = Monitor(
@@ -1089,11 +1286,12 @@ async def setup_local_monitor(
             longitude=lon,
             is_active=True,
             is_local=True,
-            last_seen=datetime.utcnow(),
+            last_seen=now,
         )
         db.add(monitor)
 
     await db.flush()
+    _map_cache.clear()
 
     logger.info(f"Local monitor '{monitor.name}' set up at ({lat}, {lon}) via {method}")
 
@@ -1144,125 +1342,78 @@ class SettingsUpdateRequest(BaseModel):
     wifi_interface: Optional[str] = Field(None, max_length=50)
 
 
-@router.get("/settings", response_model=SettingsResponse)
+# Runtime-editable settings: config table keys and Settings attributes alike
+SETTING_FIELDS = tuple(SettingsResponse.model_fields)
+
+# Last GET /settings payload; replaced whenever settings are updated
+_settings_snapshot: Optional[dict] = None
+
+
+@router.get(
+    "/settings",
+    response_class=ORJSONResponse,
+    responses={200: {"model": SettingsResponse}},
+)
 async def get_settings(
     db: AsyncSession = Depends(get_db),
 ):
     """Get current application settings."""
-    # Get DB-stored settings (override defaults)
-    db_config = await get_all_config(db)
-
-    return SettingsResponse(
-        log_retention_days=int(db_config.get("log_retention_days", settings.log_retention_days)),
-        monitor_latitude=float(db_config.get("monitor_latitude", settings.monitor_latitude)),
-        monitor_longitude=float(db_config.get("monitor_longitude", settings.monitor_longitude)),
-        monitor_name=db_config.get("monitor_name", settings.monitor_name),
-        presence_timeout_minutes=int(db_config.get("presence_timeout_minutes", settings.presence_timeout_minutes)),
-        notification_cooldown_minutes=int(db_config.get("notification_cooldown_minutes", settings.notification_cooldown_minutes)),
-        default_signal_threshold=int(db_config.get("default_signal_threshold", settings.default_signal_threshold)),
-        signal_tx_power=int(db_config.get("signal_tx_power", settings.signal_tx_power)),
-        signal_path_loss=float(db_config.get("signal_path_loss", settings.signal_path_loss)),
-        signal_averaging_window=int(db_config.get("signal_averaging_window", settings.signal_averaging_window)),
-        wifi_interface=db_config.get("wifi_interface", settings.wifi_interface),
-    )
+    global _settings_snapshot
+
+    if _settings_snapshot is None:
+        # Get DB-stored settings (override defaults)
+        db_config = await get_all_config(db)
 
+        # Stored values are strings; SettingsResponse validation converts them
+        current = SettingsResponse(**{
+            name: db_config.get(name, getattr(settings, name)) for name in SETTING_FIELDS
+        })
+        _settings_snapshot = current.model_dump()
 
-@router.patch("/settings", response_model=SettingsResponse)
+    return ORJSONResponse(_settings_snapshot)
+
+
+@router.patch(
+    "/settings",
+    response_class=ORJSONResponse,
+    responses={200: {"model": SettingsResponse}},
+)
 async def update_settings(
     data: SettingsUpdateRequest,
     db: AsyncSession = Depends(get_db),
 ):
     """Update application settings."""
-    from sqlalchemy import select
-    from manomonitor.database.models import Monitor
-
-    # Update each provided setting
-    updated = []
-
-    if data.log_retention_days is not None:
-        await set_config(db, "log_retention_days", str(data.log_retention_days))
-        settings.log_retention_days = data.log_retention_days
-        updated.append("log_retention_days")
-
-    if data.monitor_latitude is not None:
-        await set_config(db, "monitor_latitude", str(data.monitor_latitude))
-        settings.monitor_latitude = data.monitor_latitude
-        updated.append("monitor_latitude")
-
-    if data.monitor_longitude is not None:
-        await set_config(db, "monitor_longitude", str(data.monitor_longitude))
-        settings.monitor_longitude = data.monitor_longitude
-        updated.append("monitor_longitude")
-
-    if data.monitor_name is not None:
-        await set_config(db, "monitor_name", data.monitor_name)
-        settings.monitor_name = data.monitor_name
-        updated.append("monitor_name")
-
-    if data.presence_timeout_minutes is not None:
-        await set_config(db, "presence_timeout_minutes", str(data.presence_timeout_minutes))
-        settings.presence_timeout_minutes = data.presence_timeout_minutes
-        updated.append("presence_timeout_minutes")
-
-    if data.notification_cooldown_minutes is not None:
-        await set_config(db, "notification_cooldown_minutes", str(data.notification_cooldown_minutes))
-        settings.notification_cooldown_minutes = data.notification_cooldown_minutes
-        updated.append("notification_cooldown_minutes")
-
-    if data.default_signal_threshold is not None:
-        await set_config(db, "default_signal_threshold", str(data.default_signal_threshold))
-        settings.default_signal_threshold = data.default_signal_threshold
-        updated.append("default_signal_threshold")
-
-    if data.signal_tx_power is not None:
-        await set_config(db, "signal_tx_power", str(data.signal_tx_power))
-        settings.signal_tx_power = data.signal_tx_power
-        updated.append("signal_tx_power")
-
-    if data.signal_path_loss is not None:
-        await set_config(db, "signal_path_loss", str(data.signal_path_loss))
-        settings.signal_path_loss = data.signal_path_loss
-        updated.append("signal_path_loss")
-
-    if data.signal_averaging_window is not None:
-        await set_config(db, "signal_averaging_window", str(data.signal_averaging_window))
-        settings.signal_averaging_window = data.signal_averaging_window
-        updated.append("signal_averaging_window")
-
-    if data.wifi_interface is not None:
-        await set_config(db, "wifi_interface", data.wifi_interface)
-        settings.wifi_interface = data.wifi_interface
-        updated.append("wifi_interface")
-
-    # If location changed, update local monitor if it exists
-    if "monitor_latitude" in updated or "monitor_longitude" in updated:
-        result = await db.execute(select(Monitor).where(Monitor.is_local == True))
-        local_monitor = result.scalar_one_or_none()
-        if local_monitor:
-            local_monitor.latitude = settings.monitor_latitude
-            local_monitor.longitude = settings.monitor_longitude
-            local_monitor.last_seen = datetime.utcnow()
-            logger.info(f"Updated local monitor location to ({settings.monitor_latitude}, {settings.monitor_longitude})")
-
-    if "monitor_name" in updated:
-        result = await db.execute(select(Monitor).where(Monitor.is_local == True))
-        local_monitor = result.scalar_one_or_none()
+    global _settings_snapshot
+
+    # Only the fields the client actually sent (and didn't null out)
+    changes = data.model_dump(exclude_unset=True, exclude_none=True)
+
+    # Persist every provided setting in one round-trip, then apply in memory
+    await set_configs(db, {name: str(value) for name, value in changes.items()})
+    settings.apply(changes)
+    updated = list(changes)
+
+    # Keep the local monitor (if any) in sync with location/name changes
+    location_changed = "monitor_latitude" in changes or "monitor_longitude" in changes
+    if location_changed or "monitor_name" in changes:
+        local_monitor = await get_local_monitor(db)
         if local_monitor:
-            local_monitor.name = settings.monitor_name
+            if location_changed:
+                local_monitor.latitude = settings.monitor_latitude
+                local_monitor.longitude = settings.monitor_longitude
+                local_monitor.last_seen = datetime.utcnow()
+                logger.info(f"Updated local monitor location to ({settings.monitor_latitude}, {settings.monitor_longitude})")
+            if "monitor_name" in changes:
+                local_monitor.name = settings.monitor_name
+
+    # Commit before publishing the new GET payload, so a failed write never
+    # leaves GET /settings serving values that weren't persisted
+    await db.commit()
 
     logger.info(f"Settings updated: {', '.join(updated)}")
+    _map_cache.clear()
 
-    # Return current settings
-    return SettingsResponse(
-        log_retention_days=settings.log_retention_days,
-        monitor_latitude=settings.monitor_latitude,
-        monitor_longitude=settings.monitor_longitude,
-        monitor_name=settings.monitor_name,
-        presence_timeout_minutes=settings.presence_timeout_minutes,
-        notification_cooldown_minutes=settings.notification_cooldown_minutes,
-        default_signal_threshold=settings.default_signal_threshold,
-        signal_tx_power=settings.signal_tx_power,
-        signal_path_loss=settings.signal_path_loss,
-        signal_averaging_window=settings.signal_averaging_window,
-        wifi_interface=settings.wifi_interface,
-    )
+    # Return current settings (already validated on the way in). This is also
+    # the new GET payload, so GET doesn't have to re-read the config table.
+    _settings_snapshot = {name: getattr(settings, name) for name in SETTING_FIELDS}
+    return ORJSONResponse(_settings_snapshot)
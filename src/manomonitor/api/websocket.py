@@ -1,19 +1,25 @@
 """WebSocket support for real-time updates."""
 
 import asyncio
-import json
 import logging
 from datetime import datetime
 from typing import Set
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
+from manomonitor.api.responses import json_dumps
 from manomonitor.database.connection import get_db_context
-from manomonitor.database.crud import get_all_assets, get_statistics
+from manomonitor.database.crud import get_all_assets_lite, get_statistics
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Seconds a client gets to accept a broadcast before it is dropped
+SEND_TIMEOUT = 2.0
+
+# Seconds between update broadcasts
+BROADCAST_INTERVAL = 5.0
+
 
 class ConnectionManager:
     """Manages WebSocket connections for real-time updates."""
@@ -22,11 +28,14 @@ class ConnectionManager:
         self.active_connections: Set[WebSocket] = set()
         self._broadcast_task: asyncio.Task | None = None
         self._running = False
+        # Fingerprint of the last broadcast's contents, to skip idle ticks
+        self._last_digest: int | None = None
 
     async def connect(self, websocket: WebSocket) -> None:
         """Accept a new WebSocket connection."""
         await websocket.accept()
         self.active_connections.add(websocket)
+        self._last_digest = None  # make sure the new client gets the next update
         logger.info(f"WebSocket connected. Total connections: {len(self.active_connections)}")
 
         # Start broadcast task if not running
@@ -47,52 +56,71 @@ class ConnectionManager:
         if not self.active_connections:
             return
 
-        message_json = json.dumps(message, default=str)
-        disconnected = set()
-
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message_json)
-            except Exception:
-                disconnected.add(connection)
-
-        # Remove disconnected clients
-        self.active_connections -= disconnected
+        message_json = json_dumps(message).decode()
+
+        # Send to everyone concurrently so one slow client doesn't hold up the
+        # rest; a client that can't take the message in time is dropped
+        connections = tuple(self.active_connections)
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(connection.send_text(message_json), timeout=SEND_TIMEOUT)
+                for connection in connections
+            ),
+            return_exceptions=True,
+        )
+        # Remove disconnected clients (only those from this snapshot; others
+        # may have connected while the sends were in flight)
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                self.active_connections.discard(connection)
 
     async def _broadcast_loop(self) -> None:
         """Periodically broadcast device updates."""
-        while self._running:
-            try:
-                async with get_db_context() as db:
+        # One read-only session for the life of the loop; each tick ends its
+        # transaction so the next one sees fresh data
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+
+        async with get_db_context() as db:
+            while self._running:
+                # Ticks are scheduled on a fixed clock, so slow queries don't
+                # stretch the interval between updates
+                next_tick += BROADCAST_INTERVAL
+                try:
                     # Get current stats
                     stats = await get_statistics(db)
 
                     # Get recently seen devices (present)
-                    assets = await get_all_assets(db, limit=20, present_only=True)
-
-                    # Build update message
-                    message = {
-                        "type": "update",
-                        "timestamp": datetime.utcnow().isoformat(),
-                        "stats": stats,
-                        "present_devices": [
-                            {
-                                "id": a.id,
-                                "name": a.display_name,
-                                "mac": a.mac_address,
-                                "signal": a.last_signal_strength,
-                                "minutes_ago": a.minutes_since_seen,
-                            }
-                            for a in assets
-                        ],
-                    }
-
-                    await self.broadcast(message)
-
-            except Exception as e:
-                logger.error(f"Error in broadcast loop: {e}")
-
-            await asyncio.sleep(5)  # Update every 5 seconds
+                    present_devices = await get_all_assets_lite(
+                        db, limit=20, present_only=True
+                    )
+                    await db.rollback()
+
+                    # Nothing to send if the stats and devices are unchanged
+                    digest = hash((
+                        tuple(stats.items()),
+                        tuple(tuple(d.values()) for d in present_devices),
+                    ))
+                    if digest != self._last_digest:
+                        self._last_digest = digest
+                        await self.broadcast({
+                            "type": "update",
+                            "timestamp": datetime.utcnow().isoformat(),
+                            "stats": stats,
+                            "present_devices": present_devices,
+                        })
+
+                except Exception as e:
+                    logger.error(f"Error in broadcast loop: {e}")
+                    await db.rollback()
+
+                delay = next_tick - loop.time()
+                if delay < -BROADCAST_INTERVAL:
+                    # More than two intervals behind: skip the missed ticks
+                    # rather than firing them back to back
+                    logger.warning("WebSocket broadcast falling behind, skipping ticks")
+                    next_tick = loop.time()
+                await asyncio.sleep(max(0.0, delay))
 
     async def start_broadcast(self) -> None:
         """Start the broadcast loop."""
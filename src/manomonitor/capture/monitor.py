@@ -2,19 +2,33 @@
 
 import asyncio
 import logging
-import re
 import shutil
 import subprocess
 from dataclasses import dataclass
 from datetime import datetime
 from typing import AsyncGenerator, Callable, Optional
 
+import orjson
+
 from manomonitor.config import settings
 from manomonitor.database.connection import get_db_context
-from manomonitor.database.crud import create_or_update_asset
+from manomonitor.database.crud import create_or_update_asset, create_or_update_assets_bulk
 
 logger = logging.getLogger(__name__)
 
+# Bytes allowed in a MAC address column of tshark output
+_MAC_CHARS = frozenset(b"0123456789abcdefABCDEF:")
+
+# Bytes read from tshark's stdout per call
+_READ_CHUNK_SIZE = 65536
+
+
+def _first(value):
+    """First value of a tshark -T ek field (a list, or a scalar in older versions)."""
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
 
 @dataclass
 class ProbeRequest:
@@ -48,11 +62,10 @@ class ProbeCapture:
         self._running = False
         self._task: Optional[asyncio.Task] = None
 
-        # Regex to parse tshark output
-        # Format: MAC_ADDRESS\tSIGNAL_STRENGTH\tSSID
-        self._line_pattern = re.compile(
-            r"^([0-9a-fA-F:]{17})\t(-?\d+)?\t?(.*)$"
-        )
+        # Probes are buffered and written in one transaction per batch
+        self._pending: list[ProbeRequest] = []
+        self._flush_interval = 0.5  # seconds
+        self._batch_size = 64
 
     @staticmethod
     def check_dependencies() -> tuple[bool, str]:
@@ -128,45 +141,96 @@ class ProbeCapture:
             return False, f"Error setting monitor mode: {e}"
 
     def _build_tshark_command(self) -> list[str]:
-        """Build the tshark command for capturing probe requests."""
+        """
+        Build the tshark command for capturing probe requests.
+
+        The BPF capture filter drops other frames in the kernel before they
+        reach tshark; it needs an 802.11 link type, which mac80211 interfaces
+        in monitor mode provide. The display filter stays as a safeguard.
+        """
         return [
             "tshark",
             "-i", self.interface,
             "-l",  # Line-buffered output
             "-n",  # Don't resolve names
+            "-f", "type mgt subtype probe-req",  # Kernel-side capture filter
             "-Y", "wlan.fc.type_subtype == 4",  # Probe requests only
-            "-T", "fields",
+            "-T", "ek",  # Newline-delimited JSON
             "-e", "wlan.sa",  # Source MAC address
             "-e", "wlan_radio.signal_dbm",  # Signal strength
             "-e", "wlan.ssid",  # SSID being probed
-            "-E", "separator=\t",
         ]
 
-    def _parse_line(self, line: str) -> Optional[ProbeRequest]:
-        """Parse a line of tshark output into a ProbeRequest."""
+    def _parse_line(self, line: bytes | bytearray) -> Optional[ProbeRequest]:
+        """
+        Parse a line of tshark output into a ProbeRequest.
+
+        tshark runs with -T ek, which writes one JSON document per packet with
+        the requested fields under "layers", each preceded by an index line.
+        Lines that aren't JSON are parsed as -T fields output instead.
+        """
         line = line.strip()
-        if not line:
+        if not line or line.startswith(b'{"index"'):
             return None
 
-        match = self._line_pattern.match(line)
-        if not match:
-            logger.debug(f"Could not parse line: {line}")
+        try:
+            doc = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            return self._parse_fields_line(line)
+
+        layers = doc.get("layers") if isinstance(doc, dict) else None
+        if not layers:
+            return None
+
+        mac = _first(layers.get("wlan_sa"))
+        if not isinstance(mac, str) or len(mac) != 17 or not _MAC_CHARS.issuperset(mac.encode()):
+            logger.debug(f"Could not parse line: {line!r}")
             return None
 
-        mac_address = match.group(1).upper()
-        signal_str = match.group(2)
-        ssid = match.group(3).strip() if match.group(3) else None
+        # Parse signal strength (first antenna if several are reported)
+        signal_strength = None
+        signal = _first(layers.get("wlan_radio_signal_dbm"))
+        if signal is not None:
+            try:
+                signal_strength = int(str(signal).split(",", 1)[0])
+            except ValueError:
+                pass
+
+        ssid = _first(layers.get("wlan_ssid"))
+        ssid = ssid.strip() if isinstance(ssid, str) else None
+
+        return ProbeRequest(
+            mac_address=mac.upper(),
+            signal_strength=signal_strength,
+            ssid=ssid if ssid else None,
+            timestamp=datetime.utcnow(),
+        )
 
-        # Parse signal strength
+    def _parse_fields_line(self, line: bytes | bytearray) -> Optional[ProbeRequest]:
+        """
+        Parse a line of -T fields output into a ProbeRequest.
+
+        Format: MAC_ADDRESS\tSIGNAL_STRENGTH\tSSID (signal and SSID may be
+        empty). Works on the raw bytes with split() rather than a regex.
+        """
+        parts = line.split(b"\t", 2)
+        mac = parts[0]
+        if len(mac) != 17 or not _MAC_CHARS.issuperset(mac):
+            logger.debug(f"Could not parse line: {line!r}")
+            return None
+
+        # Parse signal strength (multi-antenna radios report "-45,-47")
         signal_strength = None
-        if signal_str:
+        if len(parts) > 1 and parts[1]:
             try:
-                signal_strength = int(signal_str)
+                signal_strength = int(parts[1].split(b",", 1)[0])
             except ValueError:
                 pass
 
+        ssid = parts[2].decode("utf-8", errors="ignore").strip() if len(parts) > 2 else None
+
         return ProbeRequest(
-            mac_address=mac_address,
+            mac_address=mac.decode("ascii").upper(),
             signal_strength=signal_strength,
             ssid=ssid if ssid else None,
             timestamp=datetime.utcnow(),
@@ -177,41 +241,117 @@ class ProbeCapture:
         cmd = self._build_tshark_command()
         logger.info(f"Starting capture: {' '.join(cmd)}")
 
-        self._process = await asyncio.create_subprocess_exec(
+        self._process = process = await asyncio.create_subprocess_exec(
             *cmd,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
 
-        while self._running and self._process.stdout:
+        # No per-line timeout: stop() terminates tshark, which ends the
+        # stream, and cancels the processing task. Output is read in large
+        # chunks and split locally rather than through readline().
+        buffer = bytearray()
+        while self._running and process.stdout:
             try:
-                line = await asyncio.wait_for(
-                    self._process.stdout.readline(),
-                    timeout=1.0,
-                )
-                if not line:
-                    if self._process.returncode is not None:
-                        logger.error(f"tshark exited with code {self._process.returncode}")
-                        break
-                    continue
-
-                probe = self._parse_line(line.decode("utf-8", errors="ignore"))
-                if probe:
-                    yield probe
+                chunk = await process.stdout.read(_READ_CHUNK_SIZE)
+                if not chunk:
+                    if buffer:
+                        probe = self._parse_line(buffer)
+                        if probe:
+                            yield probe
+                    returncode = await process.wait()
+                    if self._running:
+                        logger.error(f"tshark exited with code {returncode}")
+                    break
+
+                buffer += chunk
+                start = 0
+                while (end := buffer.find(b"\n", start)) >= 0:
+                    probe = self._parse_line(buffer[start:end])
+                    start = end + 1
+                    if probe:
+                        yield probe
+                del buffer[:start]
 
-            except asyncio.TimeoutError:
-                continue
             except Exception as e:
                 logger.error(f"Error in capture loop: {e}")
                 await asyncio.sleep(1)
 
-    async def _process_probes(self) -> None:
-        """Main loop to process captured probes."""
-        logger.info("Starting probe processing loop")
-
+    async def _read_probes(self, queue: asyncio.Queue) -> None:
+        """Feed captured probes into the queue, then a None sentinel."""
         async for probe in self._capture_loop():
+            await queue.put(probe)
+        await queue.put(None)
+
+    @staticmethod
+    async def _next_probe(
+        queue: asyncio.Queue,
+        reader: asyncio.Task,
+        timeout: Optional[float] = None,
+    ) -> Optional[ProbeRequest]:
+        """
+        Take the next probe from the queue.
+
+        Returns None at the end-of-stream sentinel, once the reader has
+        stopped and the queue is drained, or when the timeout expires.
+        """
+        if not queue.empty():
+            return queue.get_nowait()
+        if reader.done():
+            return None
+
+        getter = asyncio.ensure_future(queue.get())
+        try:
+            await asyncio.wait(
+                {getter, reader}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            if not getter.done():
+                getter.cancel()
+        return getter.result() if getter.done() and not getter.cancelled() else None
+
+    async def _flush(self) -> None:
+        """Store the buffered probes in a single transaction."""
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+
+        try:
+            async with get_db_context() as db:
+                results = await create_or_update_assets_bulk(
+                    db,
+                    [(p.mac_address, p.signal_strength, p.ssid) for p in batch],
+                )
+                new_macs = [asset.mac_address for asset, is_new in results if is_new]
+            stored = batch
+        except Exception as e:
+            # Don't let one bad probe take the whole batch down with it
+            logger.warning(f"Error storing {len(batch)} probes, retrying one by one: {e}")
+            stored, new_macs = await self._store_each(batch)
+
+        for mac_address in new_macs:
+            logger.info(f"New device: {mac_address}")
+
+        # Call callback if provided
+        if self.on_probe:
+            for probe in stored:
+                try:
+                    self.on_probe(probe)
+                except Exception as e:
+                    logger.error(f"Error in probe callback: {e}")
+
+    async def _store_each(
+        self, batch: list[ProbeRequest]
+    ) -> tuple[list[ProbeRequest], list[str]]:
+        """
+        Store probes in separate transactions, skipping any that fail.
+
+        Returns the stored probes and the MAC addresses of new devices.
+        """
+        stored: list[ProbeRequest] = []
+        new_macs: list[str] = []
+        for probe in batch:
             try:
-                # Store in database
                 async with get_db_context() as db:
                     asset, is_new = await create_or_update_asset(
                         db,
@@ -219,19 +359,51 @@ class ProbeCapture:
                         signal_strength=probe.signal_strength,
                         ssid=probe.ssid,
                     )
+            except Exception as e:
+                logger.error(f"Error processing probe {probe}: {e}")
+                continue
+            stored.append(probe)
+            if is_new:
+                new_macs.append(probe.mac_address)
+        return stored, new_macs
+
+    async def _process_probes(self) -> None:
+        """
+        Main loop to process captured probes.
+
+        Probes are buffered until the batch is full or the flush interval has
+        passed since the first buffered probe, then written together.
+        """
+        logger.info("Starting probe processing loop")
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._batch_size * 16)
+        reader = asyncio.create_task(self._read_probes(queue))
 
-                    if is_new:
-                        logger.info(f"New device: {probe.mac_address}")
+        try:
+            while (probe := await self._next_probe(queue, reader)) is not None:
+                self._pending.append(probe)
 
-                # Call callback if provided
-                if self.on_probe:
-                    try:
-                        self.on_probe(probe)
-                    except Exception as e:
-                        logger.error(f"Error in probe callback: {e}")
+                deadline = loop.time() + self._flush_interval
+                while len(self._pending) < self._batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    probe = await self._next_probe(queue, reader, timeout)
+                    if probe is None:
+                        break
+                    self._pending.append(probe)
 
+                await self._flush()
+        finally:
+            reader.cancel()
+            try:
+                await reader
+            except asyncio.CancelledError:
+                pass
             except Exception as e:
-                logger.error(f"Error processing probe: {e}")
+                logger.error(f"Error in capture loop: {e}")
+            await self._flush()
 
     async def start(self) -> None:
         """Start capturing probes in the background."""
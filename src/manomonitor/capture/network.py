@@ -6,12 +6,14 @@ which reveals their real MAC address (not randomized like probe requests).
 
 import asyncio
 import logging
+import os
 import re
 import subprocess
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import AsyncGenerator, Callable, Optional
+from typing import AsyncGenerator, Callable, Iterator, Optional
 
 from manomonitor.config import settings
 from manomonitor.database.connection import get_db_context
@@ -19,6 +21,35 @@ from manomonitor.database.crud import create_or_update_asset
 
 logger = logging.getLogger(__name__)
 
+# Kernel ARP (IPv4 neighbour) table
+ARP_TABLE_PATH = "/proc/net/arp"
+
+_MAC_CHARS = frozenset("0123456789abcdefABCDEF:")
+
+
+def _is_mac(value: str) -> bool:
+    """Whether value looks like a colon-separated MAC address."""
+    return len(value) == 17 and _MAC_CHARS.issuperset(value)
+
+
+def _needs_store(
+    last_stored: dict[str, tuple[Optional[str], Optional[str], float]],
+    mac: str,
+    ip: Optional[str],
+    hostname: Optional[str],
+) -> bool:
+    """
+    Whether a device seen by a monitor loop should be written to the database.
+
+    True for a MAC not stored yet or whose IP/hostname changed. Unchanged
+    devices are still refreshed every half presence timeout so their
+    last_seen doesn't age them into "away".
+    """
+    previous = last_stored.get(mac)
+    if previous is None or previous[:2] != (ip, hostname):
+        return True
+    return time.monotonic() - previous[2] >= settings.presence_timeout_minutes * 30
+
 
 @dataclass
 class NetworkDevice:
@@ -51,19 +82,18 @@ class ARPMonitor:
         self.on_device = on_device
         self._running = False
         self._task: Optional[asyncio.Task] = None
-        self._known_macs: set[str] = set()
+        # MAC -> (ip, hostname, monotonic time) of the last database write
+        self._last_stored: dict[str, tuple[Optional[str], Optional[str], float]] = {}
         self._scan_interval = 30  # seconds between scans
 
-        # Regex to parse ARP table entries
-        # Format: IP address HW type Flags HW address Mask Device
-        self._arp_pattern = re.compile(
-            r"(\d+\.\d+\.\d+\.\d+)\s+\S+\s+\S+\s+([0-9a-fA-F:]{17})"
-        )
-
     @staticmethod
     def check_dependencies() -> tuple[bool, str]:
         """Check if required tools are available."""
-        # Check for arp command
+        # The kernel's neighbour table is read directly when available
+        if Path(ARP_TABLE_PATH).exists():
+            return True, "All dependencies available"
+
+        # Otherwise fall back to the arp command
         try:
             result = subprocess.run(
                 ["which", "arp"],
@@ -77,50 +107,83 @@ class ARPMonitor:
 
         return True, "All dependencies available"
 
+    async def _read_arp_output(self) -> str:
+        """
+        Return the ARP table as text.
+
+        Reads /proc/net/arp, falling back to running `arp -n` where procfs
+        isn't available.
+        """
+        try:
+            return Path(ARP_TABLE_PATH).read_text()
+        except OSError:
+            pass
+
+        proc = await asyncio.create_subprocess_exec(
+            "arp", "-n",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, _ = await proc.communicate()
+        return stdout.decode()
+
+    def _iter_arp_entries(self, output: str) -> Iterator[tuple[str, str]]:
+        """
+        Lazily parse /proc/net/arp or `arp -n` output into (ip, mac) tuples.
+
+        Lines start with the IP address, and the hardware address is the
+        second or third column ("IP HWtype HWaddress ..." from `arp -n`, or
+        "IP HWtype Flags HWaddress ..." in /proc/net/arp layout).
+        """
+        for line in output.split("\n"):
+            fields = line.split(None, 4)
+            if len(fields) < 3 or fields[0].count(".") != 3:
+                continue
+            mac = next((f for f in fields[2:4] if _is_mac(f)), None)
+            if mac:
+                mac = mac.upper()
+                # Skip incomplete entries
+                if mac != "00:00:00:00:00:00":
+                    yield fields[0], mac
+
     async def _get_arp_table(self) -> list[tuple[str, str]]:
         """Get current ARP table entries. Returns list of (ip, mac) tuples."""
         try:
-            proc = await asyncio.create_subprocess_exec(
-                "arp", "-n",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, _ = await proc.communicate()
-
-            entries = []
-            for line in stdout.decode().split("\n"):
-                match = self._arp_pattern.search(line)
-                if match:
-                    ip = match.group(1)
-                    mac = match.group(2).upper()
-                    # Skip incomplete entries
-                    if mac != "00:00:00:00:00:00":
-                        entries.append((ip, mac))
-
-            return entries
+            return list(self._iter_arp_entries(await self._read_arp_output()))
         except Exception as e:
             logger.error(f"Error reading ARP table: {e}")
             return []
 
+    async def _get_arp_sample(self, n: int = 5) -> tuple[int, list[tuple[str, str]]]:
+        """
+        Count ARP table entries and return the first n of them.
+
+        Unlike _get_arp_table(), this doesn't build a list of every entry.
+        Raises on failure so callers can report the error.
+        """
+        count = 0
+        sample: list[tuple[str, str]] = []
+        for entry in self._iter_arp_entries(await self._read_arp_output()):
+            if count < n:
+                sample.append(entry)
+            count += 1
+        return count, sample
+
     async def _scan_network(self) -> None:
-        """Perform a network scan to populate ARP table."""
-        try:
-            # Get local subnet
-            proc = await asyncio.create_subprocess_exec(
-                "ip", "route", "show", "default",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, _ = await proc.communicate()
+        """
+        Broadcast-ping the network to populate the ARP table.
 
-            # Try to ping broadcast to populate ARP
-            # This is a quick way to discover active devices
+        Only runs with arp_active_scan enabled: most kernels ignore broadcast
+        pings (net.ipv4.icmp_echo_ignore_broadcasts=1), so by default the
+        table is left to fill from normal traffic.
+        """
+        try:
             proc = await asyncio.create_subprocess_exec(
                 "ping", "-c", "1", "-b", "255.255.255.255",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
             )
-            await proc.communicate()
+            await proc.wait()
         except Exception as e:
             logger.debug(f"Network scan error (non-fatal): {e}")
 
@@ -131,16 +194,13 @@ class ARPMonitor:
         while self._running:
             try:
                 # Optionally trigger a scan to populate ARP table
-                await self._scan_network()
+                if settings.arp_active_scan:
+                    await self._scan_network()
 
                 # Get current ARP entries
                 entries = await self._get_arp_table()
 
                 for ip, mac in entries:
-                    # Check if this is a new device
-                    is_new = mac not in self._known_macs
-                    self._known_macs.add(mac)
-
                     # Create device object
                     device = NetworkDevice(
                         mac_address=mac,
@@ -150,17 +210,19 @@ class ARPMonitor:
                         timestamp=datetime.utcnow(),
                     )
 
-                    # Store in database
-                    async with get_db_context() as db:
-                        asset, created = await create_or_update_asset(
-                            db,
-                            mac_address=mac,
-                            signal_strength=None,  # No signal strength from ARP
-                            ssid=None,
-                        )
+                    # Store in database if new, changed or due a refresh
+                    if _needs_store(self._last_stored, mac, ip, None):
+                        async with get_db_context() as db:
+                            asset, created = await create_or_update_asset(
+                                db,
+                                mac_address=mac,
+                                signal_strength=None,  # No signal strength from ARP
+                                ssid=None,
+                            )
 
-                        if created:
-                            logger.info(f"New network device: {mac} ({ip})")
+                            if created:
+                                logger.info(f"New network device: {mac} ({ip})")
+                        self._last_stored[mac] = (ip, None, time.monotonic())
 
                     # Call callback
                     if self.on_device:
@@ -227,6 +289,14 @@ class DHCPMonitor:
         "/var/lib/misc/dnsmasq.leases",  # dnsmasq
     ]
 
+    # ISC dhcpd lease file patterns
+    _RE_LEASE_BLOCK = re.compile(
+        r"lease\s+(\d+\.\d+\.\d+\.\d+)\s*\{([^}]+)\}", re.DOTALL
+    )
+    _RE_HARDWARE = re.compile(r"hardware\s+ethernet\s+([0-9a-fA-F:]+)")
+    _RE_HOSTNAME = re.compile(r'client-hostname\s+"([^"]+)"')
+    _RE_STARTS = re.compile(r"starts\s+\d+\s+(\d{4}/\d{2}/\d{2}\s+\d{2}:\d{2}:\d{2})")
+
     def __init__(
         self,
         lease_file: Optional[str] = None,
@@ -236,9 +306,14 @@ class DHCPMonitor:
         self.on_device = on_device
         self._running = False
         self._task: Optional[asyncio.Task] = None
-        self._known_macs: set[str] = set()
+        # MAC -> (ip, hostname, monotonic time) of the last database write
+        self._last_stored: dict[str, tuple[Optional[str], Optional[str], float]] = {}
         self._check_interval = 60  # seconds
 
+        # Last parse result, reused while the lease file is unchanged
+        self._last_mtime_ns: int = 0
+        self._last_devices: list[NetworkDevice] = []
+
         # Try to find lease file if not specified
         if not self.lease_file:
             self.lease_file = self._find_lease_file()
@@ -288,17 +363,11 @@ class DHCPMonitor:
         """Parse ISC DHCP-style lease file."""
         devices = []
 
-        # Simple regex-based parsing
-        lease_blocks = re.findall(
-            r"lease\s+(\d+\.\d+\.\d+\.\d+)\s*\{([^}]+)\}",
-            content,
-            re.DOTALL
-        )
-
-        for ip, block in lease_blocks:
-            mac_match = re.search(r"hardware\s+ethernet\s+([0-9a-fA-F:]+)", block)
-            hostname_match = re.search(r'client-hostname\s+"([^"]+)"', block)
-            time_match = re.search(r"starts\s+\d+\s+(\d{4}/\d{2}/\d{2}\s+\d{2}:\d{2}:\d{2})", block)
+        for lease in self._RE_LEASE_BLOCK.finditer(content):
+            ip, block = lease.groups()
+            mac_match = self._RE_HARDWARE.search(block)
+            hostname_match = self._RE_HOSTNAME.search(block)
+            time_match = self._RE_STARTS.search(block)
 
             if mac_match:
                 mac = mac_match.group(1).upper()
@@ -322,23 +391,36 @@ class DHCPMonitor:
         return devices
 
     async def _read_leases(self) -> list[NetworkDevice]:
-        """Read and parse DHCP lease file."""
-        if not self.lease_file or not Path(self.lease_file).exists():
+        """Read and parse DHCP lease file, skipping the parse if it is unchanged."""
+        if not self.lease_file:
             return []
 
+        try:
+            st = os.stat(self.lease_file)
+        except OSError:
+            return []
+        if st.st_size == 0:
+            return []
+        if st.st_mtime_ns == self._last_mtime_ns:
+            return self._last_devices
+
         try:
             content = Path(self.lease_file).read_text()
 
             # Detect format and parse
             if "lease " in content and "hardware ethernet" in content:
-                return await self._parse_isc_leases(content)
+                devices = await self._parse_isc_leases(content)
             else:
-                return await self._parse_dnsmasq_leases(content)
+                devices = await self._parse_dnsmasq_leases(content)
 
         except Exception as e:
             logger.error(f"Error reading DHCP leases: {e}")
             return []
 
+        self._last_mtime_ns = st.st_mtime_ns
+        self._last_devices = devices
+        return devices
+
     async def _monitor_loop(self) -> None:
         """Main monitoring loop."""
         logger.info(f"Starting DHCP monitoring (lease file: {self.lease_file})")
@@ -348,24 +430,25 @@ class DHCPMonitor:
                 devices = await self._read_leases()
 
                 for device in devices:
-                    is_new = device.mac_address not in self._known_macs
-                    self._known_macs.add(device.mac_address)
-
-                    # Store in database
-                    async with get_db_context() as db:
-                        asset, created = await create_or_update_asset(
-                            db,
-                            mac_address=device.mac_address,
-                            signal_strength=None,
-                            ssid=None,
-                        )
-
-                        if created:
-                            logger.info(
-                                f"New DHCP device: {device.mac_address} "
-                                f"({device.ip_address}, {device.hostname or 'no hostname'})"
+                    mac, ip, hostname = device.mac_address, device.ip_address, device.hostname
+
+                    # Store in database if new, changed or due a refresh
+                    if _needs_store(self._last_stored, mac, ip, hostname):
+                        async with get_db_context() as db:
+                            asset, created = await create_or_update_asset(
+                                db,
+                                mac_address=mac,
+                                signal_strength=None,
+                                ssid=None,
                             )
 
+                            if created:
+                                logger.info(
+                                    f"New DHCP device: {mac} "
+                                    f"({ip}, {hostname or 'no hostname'})"
+                                )
+                        self._last_stored[mac] = (ip, hostname, time.monotonic())
+
                     if self.on_device:
                         try:
                             self.on_device(device)
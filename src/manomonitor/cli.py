@@ -47,6 +47,9 @@ def run(
         port=port,
         reload=debug,
         log_level="debug" if debug else "info",
+        # Compress WebSocket update frames (they are repetitive JSON)
+        ws_per_message_deflate=True,
+        ws_ping_interval=20.0,
     )
 
 
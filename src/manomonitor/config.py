@@ -1,7 +1,8 @@
 """Configuration management using Pydantic Settings."""
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -12,6 +13,33 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 _PACKAGE_ROOT = Path(__file__).parent.parent.parent
 
 
+# Resolution depends only on these two settings; memoized on them (rather than
+# on the mutable Settings instance) so a changed value is never served stale.
+@lru_cache(maxsize=4)
+def _resolve_database_url(database_url: str, data_dir: Path) -> str:
+    """Resolve the database URL, making relative SQLite paths absolute."""
+    if database_url:
+        # User provided a custom URL
+        if database_url.startswith("sqlite"):
+            # Make SQLite paths absolute if they're relative
+            parts = database_url.split("///")
+            if len(parts) == 2 and parts[1].startswith("./"):
+                db_path = data_dir / parts[1][2:]
+                return f"sqlite+aiosqlite:///{db_path}"
+        return database_url
+    # Default: SQLite in data_dir
+    db_path = data_dir / "manomonitor.db"
+    return f"sqlite+aiosqlite:///{db_path}"
+
+
+@lru_cache(maxsize=4)
+def _resolve_database_path(database_url: str) -> Path | None:
+    """SQLite database file path for a resolved URL, or None."""
+    if database_url.startswith("sqlite"):
+        return Path(database_url.split("///")[-1])
+    return None
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables or .env file."""
 
@@ -56,6 +84,10 @@ class Settings(BaseSettings):
         ge=5,
         le=300,
     )
+    arp_active_scan: bool = Field(
+        default=False,
+        description="Broadcast-ping the network before each ARP scan to populate the table",
+    )
     dhcp_monitoring_enabled: bool = Field(
         default=True,
         description="Enable DHCP lease file monitoring for connected devices",
@@ -219,26 +251,23 @@ class Settings(BaseSettings):
 
     def get_database_url(self) -> str:
         """Get the resolved database URL with absolute paths for SQLite."""
-        if self.database_url:
-            # User provided a custom URL
-            if self.database_url.startswith("sqlite"):
-                # Make SQLite paths absolute if they're relative
-                parts = self.database_url.split("///")
-                if len(parts) == 2 and parts[1].startswith("./"):
-                    db_path = self.data_dir / parts[1][2:]
-                    return f"sqlite+aiosqlite:///{db_path}"
-            return self.database_url
-        # Default: SQLite in data_dir
-        db_path = self.data_dir / "manomonitor.db"
-        return f"sqlite+aiosqlite:///{db_path}"
+        return _resolve_database_url(self.database_url, self.data_dir)
+
+    def apply(self, values: dict[str, Any]) -> None:
+        """
+        Update several settings at once.
+
+        Settings is a shared instance imported by name throughout the app, so it
+        is updated in place rather than rebound. Assigning everything in one
+        synchronous step means no other coroutine can observe a half-applied
+        update.
+        """
+        for name, value in values.items():
+            setattr(self, name, value)
 
     def get_database_path(self) -> Path | None:
         """Get the SQLite database file path if using SQLite."""
-        url = self.get_database_url()
-        if url.startswith("sqlite"):
-            db_path = url.split("///")[-1]
-            return Path(db_path)
-        return None
+        return _resolve_database_path(self.get_database_url())
 
 
 # Global settings instance
@@ -5,8 +5,10 @@ from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import AsyncGenerator
 
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import ORMExecuteState, Session
+from sqlalchemy.pool import StaticPool
 
 from manomonitor.config import settings
 from manomonitor.database.models import Base
@@ -15,15 +17,59 @@ logger = logging.getLogger(__name__)
 
 # Get resolved database URL (handles relative paths for SQLite)
 _database_url = settings.get_database_url()
+_is_sqlite = _database_url.startswith("sqlite")
+
+
+def _engine_options(url: str) -> dict:
+    """Pool configuration for the driver of the given database URL."""
+    if url.startswith("sqlite"):
+        # SQLite-specific settings for better concurrency
+        options = {"connect_args": {"check_same_thread": False}}
+        if ":memory:" in url:
+            # Every connection to :memory: is a new, empty database
+            options["poolclass"] = StaticPool
+        # File databases keep the default queue pool: reusing connections
+        # avoids reopening the file and re-applying pragmas, and concurrent
+        # sessions (e.g. the asset list and its count) each need their own.
+        return options
+
+    return {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,  # Drop server-side connections before they go stale
+    }
+
 
 # Create async engine
 engine = create_async_engine(
     _database_url,
     echo=settings.debug,
-    # SQLite-specific settings for better concurrency
-    connect_args={"check_same_thread": False} if "sqlite" in _database_url else {},
+    **_engine_options(_database_url),
+)
+
+# Per-connection SQLite tuning. Unlike journal_mode these don't persist in the
+# database file, so they are applied to every pooled connection as it opens.
+_SQLITE_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-64000",  # 64MB cache
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256MB memory-mapped reads
+    "PRAGMA wal_autocheckpoint=10000",  # checkpoint every ~40MB of WAL
+    "PRAGMA busy_timeout=5000",  # wait up to 5s for a write lock
 )
 
+if _is_sqlite:
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in _SQLITE_CONNECTION_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
 # Session factory
 async_session_maker = async_sessionmaker(
     engine,
@@ -34,8 +80,49 @@ async_session_maker = async_sessionmaker(
 )
 
 
+# Bump whenever a migration is added to _run_migrations. Stored in SQLite's
+# PRAGMA user_version so up-to-date databases skip the migration checks.
+SCHEMA_VERSION = 2
+
+
+# Session.info flag set once a session has sent anything other than a SELECT.
+# Core INSERT/UPDATE statements and flushed ORM changes leave nothing in
+# session.new/dirty/deleted, so those alone can't tell whether to commit.
+_HAS_WRITES = "has_writes"
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush(session: Session, flush_context) -> None:
+    session.info[_HAS_WRITES] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_write_statement(orm_execute_state: ORMExecuteState) -> None:
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info[_HAS_WRITES] = True
+
+
+def _needs_commit(session: AsyncSession) -> bool:
+    """Whether the session has written anything that still needs committing."""
+    if not session.in_transaction():
+        return False
+    return bool(
+        session.info.get(_HAS_WRITES)
+        or session.new
+        or session.dirty
+        or session.deleted
+    )
+
+
 async def _run_migrations(conn) -> None:
-    """Run simple schema migrations for SQLite."""
+    """Run simple schema migrations for SQLite, once per schema version."""
+    result = await conn.execute(text("PRAGMA user_version"))
+    current_version = result.scalar() or 0
+    if current_version >= SCHEMA_VERSION:
+        return
+
+    failed = False
+
     # Get existing columns in assets table
     result = await conn.execute(text("PRAGMA table_info(assets)"))
     existing_columns = {row[1] for row in result.fetchall()}
@@ -56,8 +143,35 @@ async def _run_migrations(conn) -> None:
                 await conn.execute(text(sql))
                 logger.info(f"Migration: Added column '{column_name}' to assets table")
             except Exception as e:
+                failed = True
                 logger.warning(f"Migration failed for column '{column_name}': {e}")
 
+    # Indexes added after the initial schema (create_all skips existing tables)
+    index_migrations = [
+        (
+            "ix_signal_readings_asset_timestamp",
+            "CREATE INDEX IF NOT EXISTS ix_signal_readings_asset_timestamp "
+            "ON signal_readings (asset_id, timestamp)",
+        ),
+        (
+            "ix_probe_logs_timestamp_asset_signal",
+            "CREATE INDEX IF NOT EXISTS ix_probe_logs_timestamp_asset_signal "
+            "ON probe_logs (timestamp, asset_id, signal_strength)",
+        ),
+    ]
+
+    for index_name, sql in index_migrations:
+        try:
+            await conn.execute(text(sql))
+        except Exception as e:
+            failed = True
+            logger.warning(f"Migration failed for index '{index_name}': {e}")
+
+    # Leave the version alone on failure so the next startup retries
+    if not failed:
+        await conn.execute(text(f"PRAGMA user_version = {SCHEMA_VERSION}"))
+        logger.info(f"Database schema at version {SCHEMA_VERSION}")
+
 
 async def init_db() -> None:
     """Initialize the database, creating tables if they don't exist."""
@@ -69,11 +183,8 @@ async def init_db() -> None:
 
     async with engine.begin() as conn:
         # Enable WAL mode for SQLite for better concurrency
-        if "sqlite" in _database_url:
+        if _is_sqlite:
             await conn.execute(text("PRAGMA journal_mode=WAL"))
-            await conn.execute(text("PRAGMA synchronous=NORMAL"))
-            await conn.execute(text("PRAGMA cache_size=-64000"))  # 64MB cache
-            await conn.execute(text("PRAGMA temp_store=MEMORY"))
             logger.info("SQLite optimizations applied (WAL mode, etc.)")
 
         # Create all tables
@@ -81,7 +192,7 @@ async def init_db() -> None:
         logger.info("Database tables created/verified")
 
         # Run migrations for existing databases
-        if "sqlite" in _database_url:
+        if _is_sqlite:
             await _run_migrations(conn)
 
 
@@ -97,7 +208,9 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_maker() as session:
         try:
             yield session
-            await session.commit()
+            # Read-only sessions just close; no COMMIT round-trip
+            if _needs_commit(session):
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -117,7 +230,9 @@ async def get_db_context() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_maker() as session:
         try:
             yield session
-            await session.commit()
+            # Read-only sessions just close; no COMMIT round-trip
+            if _needs_commit(session):
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -1,18 +1,36 @@
 """Database CRUD (Create, Read, Update, Delete) operations."""
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Optional, Sequence
+from typing import TYPE_CHECKING, AsyncIterator, Optional, Sequence
 
-from sqlalchemy import delete, func, or_, select, update
+from sqlalchemy import Select, delete, func, or_, select, text, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from manomonitor.config import settings
-from manomonitor.database.models import Asset, Config, NotificationLog, ProbeLog, SSIDHistory
+from manomonitor.database.models import (
+    Asset,
+    Config,
+    Monitor,
+    NotificationLog,
+    ProbeLog,
+    SSIDHistory,
+)
+
+if TYPE_CHECKING:
+    from manomonitor.utils.vendor import VendorInfo
 
 logger = logging.getLogger(__name__)
 
 
+def _columns(model: type, names: Sequence[str]) -> list:
+    """Resolve column names to table columns, for Core (non-ORM) selects."""
+    table = model.__table__
+    return [table.c[name] for name in names]
+
+
 # =============================================================================
 # Asset Operations
 # =============================================================================
@@ -27,21 +45,19 @@ async def get_asset_by_mac(db: AsyncSession, mac_address: str) -> Optional[Asset
 
 
 async def get_asset_by_id(db: AsyncSession, asset_id: int) -> Optional[Asset]:
-    """Get an asset by ID."""
-    result = await db.execute(select(Asset).where(Asset.id == asset_id))
-    return result.scalar_one_or_none()
-
-
-async def get_all_assets(
-    db: AsyncSession,
-    limit: int = 100,
-    offset: int = 0,
-    include_hidden: bool = False,
-    search: Optional[str] = None,
-    notify_only: bool = False,
-    present_only: bool = False,
-) -> Sequence[Asset]:
-    """Get all assets with optional filtering."""
+    """Get an asset by ID (from the session's identity map if already loaded)."""
+    return await db.get(Asset, asset_id)
+
+
+def _assets_query(
+    limit: int,
+    offset: int,
+    include_hidden: bool,
+    search: Optional[str],
+    notify_only: bool,
+    present_only: bool,
+) -> Select:
+    """Build the filtered, paginated asset listing query."""
     query = select(Asset)
 
     # Apply filters
@@ -69,12 +85,77 @@ async def get_all_assets(
         query = query.where(Asset.last_seen >= cutoff)
 
     # Order by last seen (most recent first)
-    query = query.order_by(Asset.last_seen.desc()).offset(offset).limit(limit)
+    return query.order_by(Asset.last_seen.desc()).offset(offset).limit(limit)
+
 
+async def get_all_assets(
+    db: AsyncSession,
+    limit: int = 100,
+    offset: int = 0,
+    include_hidden: bool = False,
+    search: Optional[str] = None,
+    notify_only: bool = False,
+    present_only: bool = False,
+) -> Sequence[Asset]:
+    """Get all assets with optional filtering."""
+    query = _assets_query(
+        limit, offset, include_hidden, search, notify_only, present_only
+    )
     result = await db.execute(query)
     return result.scalars().all()
 
 
+async def get_all_assets_lite(
+    db: AsyncSession,
+    limit: int = 100,
+    present_only: bool = False,
+) -> list[dict]:
+    """
+    Get a compact summary of each asset (id, name, mac, signal, minutes_ago).
+
+    Selects only the columns needed instead of loading full Asset objects,
+    for callers that just serialize a few fields (e.g. WebSocket updates).
+    """
+    query = _assets_query(limit, 0, False, None, False, present_only).with_only_columns(
+        Asset.id.label("id"),
+        func.coalesce(func.nullif(Asset.nickname, ""), Asset.mac_address).label("name"),
+        Asset.mac_address.label("mac"),
+        Asset.last_signal_strength.label("signal"),
+        Asset.last_seen,
+    )
+    result = await db.execute(query)
+
+    now = datetime.utcnow()
+    summaries = []
+    for row in result.mappings():
+        summary = dict(row)
+        last_seen = summary.pop("last_seen")
+        # Same as Asset.minutes_since_seen
+        summary["minutes_ago"] = (
+            int((now - last_seen).total_seconds() / 60) if last_seen else -1
+        )
+        summaries.append(summary)
+    return summaries
+
+
+async def stream_assets(
+    db: AsyncSession,
+    limit: int = 100,
+    offset: int = 0,
+    include_hidden: bool = False,
+    search: Optional[str] = None,
+    notify_only: bool = False,
+    present_only: bool = False,
+) -> AsyncIterator[Asset]:
+    """Like get_all_assets, but yield rows as they are fetched."""
+    query = _assets_query(
+        limit, offset, include_hidden, search, notify_only, present_only
+    )
+    result = await db.stream_scalars(query)
+    async for asset in result:
+        yield asset
+
+
 async def get_assets_count(
     db: AsyncSession,
     include_hidden: bool = False,
@@ -92,6 +173,73 @@ async def get_assets_count(
     return result.scalar() or 0
 
 
+def _new_asset_values(
+    mac_address: str, signal_strength: Optional[int], vendor_info: "VendorInfo"
+) -> dict:
+    """Column values for a newly discovered asset, with enhanced vendor info."""
+    return {
+        "mac_address": mac_address,
+        "signal_threshold": settings.default_signal_threshold,
+        "last_signal_strength": signal_strength,
+        "vendor": vendor_info.vendor,
+        "device_type": vendor_info.device_type,
+        "vendor_country": vendor_info.country,
+        "is_virtual_machine": vendor_info.is_virtual_machine,
+    }
+
+
+def _log_new_device(mac_address: str, vendor_info: "VendorInfo") -> None:
+    """Log a newly discovered device with its vendor info."""
+    device_info = vendor_info.vendor or "Unknown"
+    if vendor_info.device_type:
+        device_info += f" ({vendor_info.device_type})"
+    if vendor_info.country:
+        device_info += f" [{vendor_info.country}]"
+    if vendor_info.is_virtual_machine:
+        device_info += " [VM]"
+    logger.info(f"New device discovered: {mac_address} - {device_info} [Source: {vendor_info.source}]")
+
+
+async def _create_asset(
+    db: AsyncSession, mac_address: str, signal_strength: Optional[int]
+) -> Asset:
+    """Create and flush a new asset, looking up its vendor info."""
+    # Look up vendor info using enhanced multi-source lookup
+    from manomonitor.utils.vendor import lookup_vendor
+
+    vendor_info = await lookup_vendor(mac_address)
+
+    asset = Asset(**_new_asset_values(mac_address, signal_strength, vendor_info))
+    db.add(asset)
+    await db.flush()
+
+    _log_new_device(mac_address, vendor_info)
+    return asset
+
+
+def _insert_ignoring_duplicates(db: AsyncSession, values: list[dict]):
+    """INSERT of new assets that skips MACs another writer already created."""
+    if db.bind.dialect.name == "postgresql":
+        stmt = postgresql.insert(Asset)
+    else:
+        stmt = sqlite.insert(Asset)
+    return (
+        stmt.values(values)
+        .on_conflict_do_nothing(index_elements=[Asset.mac_address])
+        .returning(Asset.mac_address)
+    )
+
+
+async def _group_related_macs(db: AsyncSession, asset: Asset) -> None:
+    """Check an asset for MAC randomization and group related devices."""
+    try:
+        from manomonitor.utils.mac_fingerprinting import group_randomized_macs
+
+        await group_randomized_macs(db, asset, auto_create_group=True)
+    except Exception as e:
+        logger.debug(f"Error in MAC fingerprinting: {e}")
+
+
 async def create_or_update_asset(
     db: AsyncSession,
     mac_address: str,
@@ -108,33 +256,7 @@ async def create_or_update_asset(
     is_new = asset is None
 
     if is_new:
-        # Look up vendor info using enhanced multi-source lookup
-        from manomonitor.utils.vendor import lookup_vendor
-
-        vendor_info = await lookup_vendor(mac_address)
-
-        # Create new asset with enhanced vendor info
-        asset = Asset(
-            mac_address=mac_address,
-            signal_threshold=settings.default_signal_threshold,
-            last_signal_strength=signal_strength,
-            vendor=vendor_info.vendor,
-            device_type=vendor_info.device_type,
-            vendor_country=vendor_info.country,
-            is_virtual_machine=vendor_info.is_virtual_machine,
-        )
-        db.add(asset)
-        await db.flush()
-
-        # Log with enhanced info
-        device_info = vendor_info.vendor or "Unknown"
-        if vendor_info.device_type:
-            device_info += f" ({vendor_info.device_type})"
-        if vendor_info.country:
-            device_info += f" [{vendor_info.country}]"
-        if vendor_info.is_virtual_machine:
-            device_info += " [VM]"
-        logger.info(f"New device discovered: {mac_address} - {device_info} [Source: {vendor_info.source}]")
+        asset = await _create_asset(db, mac_address, signal_strength)
     else:
         # Update existing asset
         asset.last_seen = datetime.utcnow()
@@ -157,16 +279,99 @@ async def create_or_update_asset(
     # Check for MAC randomization and group related devices
     # Do this after we have some probe logs to analyze
     if is_new or asset.times_seen % 10 == 0:  # Check new devices and periodically
-        try:
-            from manomonitor.utils.mac_fingerprinting import group_randomized_macs
-
-            await group_randomized_macs(db, asset, auto_create_group=True)
-        except Exception as e:
-            logger.debug(f"Error in MAC fingerprinting: {e}")
+        await _group_related_macs(db, asset)
 
     return asset, is_new
 
 
+async def create_or_update_assets_bulk(
+    db: AsyncSession,
+    probes: Sequence[tuple[str, Optional[int], Optional[str]]],
+) -> list[tuple[Asset, bool]]:
+    """
+    Record a batch of (mac_address, signal_strength, ssid) probes.
+
+    Same effect as calling create_or_update_asset() for each probe, but the
+    known assets are loaded with one query and each asset and SSID is updated
+    once per batch, so a burst of probes costs a single transaction.
+
+    Returns (asset, is_new) for each distinct MAC address in the batch.
+    """
+    by_mac: dict[str, list[tuple[Optional[int], Optional[str]]]] = {}
+    for mac_address, signal_strength, ssid in probes:
+        by_mac.setdefault(mac_address.upper(), []).append((signal_strength, ssid))
+    if not by_mac:
+        return []
+
+    result = await db.execute(select(Asset).where(Asset.mac_address.in_(list(by_mac))))
+    existing = {asset.mac_address: asset for asset in result.scalars()}
+
+    created: set[str] = set()
+    new_macs = [mac_address for mac_address in by_mac if mac_address not in existing]
+    if new_macs:
+        # Vendor lookups may go to the network; run them concurrently and
+        # before anything is written, so the write lock isn't held meanwhile
+        from manomonitor.utils.vendor import lookup_vendor
+
+        vendor_infos = await asyncio.gather(*(lookup_vendor(mac) for mac in new_macs))
+
+        values = []
+        for mac_address, vendor_info in zip(new_macs, vendor_infos):
+            signals = [signal for signal, _ in by_mac[mac_address] if signal is not None]
+            row = _new_asset_values(mac_address, signals[-1] if signals else None, vendor_info)
+            row["times_seen"] = len(by_mac[mac_address])
+            values.append(row)
+
+        # A MAC created concurrently (e.g. by a monitor report) is skipped
+        # here and updated below like any other known asset
+        result = await db.execute(_insert_ignoring_duplicates(db, values))
+        created = set(result.scalars())
+        for mac_address, vendor_info in zip(new_macs, vendor_infos):
+            if mac_address in created:
+                _log_new_device(mac_address, vendor_info)
+
+        result = await db.execute(select(Asset).where(Asset.mac_address.in_(new_macs)))
+        existing.update((asset.mac_address, asset) for asset in result.scalars())
+
+    now = datetime.utcnow()
+    results = []
+    for mac_address, entries in by_mac.items():
+        asset = existing.get(mac_address)
+        if asset is None:
+            continue  # Deleted while the batch was being stored
+        is_new = mac_address in created
+
+        if is_new:
+            previous_seen = 0
+        else:
+            previous_seen = asset.times_seen
+            asset.last_seen = now
+            asset.times_seen += len(entries)
+            signals = [signal for signal, _ in entries if signal is not None]
+            if signals:
+                asset.last_signal_strength = signals[-1]
+
+        db.add_all(
+            ProbeLog(asset_id=asset.id, signal_strength=signal, ssid=ssid)
+            for signal, ssid in entries
+        )
+
+        ssid_counts: dict[str, int] = {}
+        for _, ssid in entries:
+            if ssid:
+                ssid_counts[ssid] = ssid_counts.get(ssid, 0) + 1
+        for ssid, count in ssid_counts.items():
+            await update_ssid_history(db, asset.id, ssid, count)
+
+        # Same cadence as create_or_update_asset: new devices and every 10th sighting
+        if is_new or previous_seen // 10 != asset.times_seen // 10:
+            await _group_related_macs(db, asset)
+
+        results.append((asset, is_new))
+
+    return results
+
+
 async def update_asset(
     db: AsyncSession,
     asset_id: int,
@@ -221,8 +426,10 @@ async def update_asset_notification_time(db: AsyncSession, asset_id: int) -> Non
 # =============================================================================
 
 
-async def update_ssid_history(db: AsyncSession, asset_id: int, ssid: str) -> None:
-    """Update SSID history for an asset."""
+async def update_ssid_history(
+    db: AsyncSession, asset_id: int, ssid: str, times: int = 1
+) -> None:
+    """Update SSID history for an asset, counting `times` new sightings."""
     if not ssid or not ssid.strip():
         return
 
@@ -236,22 +443,37 @@ async def update_ssid_history(db: AsyncSession, asset_id: int, ssid: str) -> Non
 
     if ssid_entry:
         ssid_entry.last_seen = datetime.utcnow()
-        ssid_entry.times_seen += 1
+        ssid_entry.times_seen += times
     else:
-        ssid_entry = SSIDHistory(asset_id=asset_id, ssid=ssid)
+        ssid_entry = SSIDHistory(asset_id=asset_id, ssid=ssid, times_seen=times)
         db.add(ssid_entry)
 
 
+def _ssid_history_query(*entities, asset_id: int) -> Select:
+    """Build the SSID history query for an asset."""
+    return (
+        select(*entities)
+        .where(SSIDHistory.asset_id == asset_id)
+        .order_by(SSIDHistory.times_seen.desc())
+    )
+
+
 async def get_ssid_history(
     db: AsyncSession, asset_id: int
 ) -> Sequence[SSIDHistory]:
     """Get all SSIDs probed by an asset."""
+    result = await db.execute(_ssid_history_query(SSIDHistory, asset_id=asset_id))
+    return result.scalars().all()
+
+
+async def get_ssid_history_rows(
+    db: AsyncSession, asset_id: int, columns: Sequence[str]
+) -> list[dict]:
+    """Get SSID history as plain dicts of the given columns (no ORM instances)."""
     result = await db.execute(
-        select(SSIDHistory)
-        .where(SSIDHistory.asset_id == asset_id)
-        .order_by(SSIDHistory.times_seen.desc())
+        _ssid_history_query(*_columns(SSIDHistory, columns), asset_id=asset_id)
     )
-    return result.scalars().all()
+    return [dict(row) for row in result.mappings()]
 
 
 # =============================================================================
@@ -305,26 +527,52 @@ async def get_newly_discovered_assets(
 # =============================================================================
 
 
-async def get_probe_logs(
-    db: AsyncSession,
+def _probe_logs_query(
+    *entities,
     asset_id: Optional[int] = None,
     limit: int = 100,
     since: Optional[datetime] = None,
-) -> Sequence[ProbeLog]:
-    """Get probe logs with optional filtering."""
-    query = select(ProbeLog)
+) -> Select:
+    """Build the probe log query with optional filtering."""
+    query = select(*entities)
 
     if asset_id:
         query = query.where(ProbeLog.asset_id == asset_id)
     if since:
         query = query.where(ProbeLog.timestamp >= since)
 
-    query = query.order_by(ProbeLog.timestamp.desc()).limit(limit)
+    return query.order_by(ProbeLog.timestamp.desc()).limit(limit)
 
-    result = await db.execute(query)
+
+async def get_probe_logs(
+    db: AsyncSession,
+    asset_id: Optional[int] = None,
+    limit: int = 100,
+    since: Optional[datetime] = None,
+) -> Sequence[ProbeLog]:
+    """Get probe logs with optional filtering."""
+    result = await db.execute(
+        _probe_logs_query(ProbeLog, asset_id=asset_id, limit=limit, since=since)
+    )
     return result.scalars().all()
 
 
+async def get_probe_log_rows(
+    db: AsyncSession,
+    columns: Sequence[str],
+    asset_id: Optional[int] = None,
+    limit: int = 100,
+    since: Optional[datetime] = None,
+) -> list[dict]:
+    """Get probe logs as plain dicts of the given columns (no ORM instances)."""
+    result = await db.execute(
+        _probe_logs_query(
+            *_columns(ProbeLog, columns), asset_id=asset_id, limit=limit, since=since
+        )
+    )
+    return [dict(row) for row in result.mappings()]
+
+
 async def purge_old_logs(db: AsyncSession, days: int) -> int:
     """Delete probe logs older than N days. Returns count of deleted rows."""
     if days <= 0:
@@ -365,23 +613,47 @@ async def log_notification(
     return log_entry
 
 
-async def get_notification_logs(
-    db: AsyncSession,
+def _notification_logs_query(
+    *entities,
     limit: int = 50,
     asset_id: Optional[int] = None,
-) -> Sequence[NotificationLog]:
-    """Get recent notification logs."""
-    query = select(NotificationLog)
+) -> Select:
+    """Build the recent notification logs query."""
+    query = select(*entities)
 
     if asset_id:
         query = query.where(NotificationLog.asset_id == asset_id)
 
-    query = query.order_by(NotificationLog.timestamp.desc()).limit(limit)
+    return query.order_by(NotificationLog.timestamp.desc()).limit(limit)
 
-    result = await db.execute(query)
+
+async def get_notification_logs(
+    db: AsyncSession,
+    limit: int = 50,
+    asset_id: Optional[int] = None,
+) -> Sequence[NotificationLog]:
+    """Get recent notification logs."""
+    result = await db.execute(
+        _notification_logs_query(NotificationLog, limit=limit, asset_id=asset_id)
+    )
     return result.scalars().all()
 
 
+async def get_notification_log_rows(
+    db: AsyncSession,
+    columns: Sequence[str],
+    limit: int = 50,
+    asset_id: Optional[int] = None,
+) -> list[dict]:
+    """Get recent notification logs as plain dicts of the given columns."""
+    result = await db.execute(
+        _notification_logs_query(
+            *_columns(NotificationLog, columns), limit=limit, asset_id=asset_id
+        )
+    )
+    return [dict(row) for row in result.mappings()]
+
+
 # =============================================================================
 # Statistics
 # =============================================================================
@@ -512,6 +784,24 @@ async def set_config(
     return config
 
 
+_UPSERT_CONFIG = text(
+    "INSERT INTO config (key, value, updated_at) "
+    "VALUES (:key, :value, CURRENT_TIMESTAMP) "
+    "ON CONFLICT (key) DO UPDATE "
+    "SET value = excluded.value, updated_at = CURRENT_TIMESTAMP"
+)
+
+
+async def set_configs(db: AsyncSession, values: dict[str, str]) -> None:
+    """Set several config values (create or update) in one statement."""
+    if not values:
+        return
+    await db.execute(
+        _UPSERT_CONFIG,
+        [{"key": key, "value": value} for key, value in values.items()],
+    )
+
+
 async def get_all_config(db: AsyncSession) -> dict[str, str]:
     """Get all config values as a dictionary."""
     result = await db.execute(select(Config))
@@ -522,3 +812,29 @@ async def delete_config(db: AsyncSession, key: str) -> bool:
     """Delete a config value."""
     result = await db.execute(delete(Config).where(Config.key == key))
     return result.rowcount > 0
+
+
+# =============================================================================
+# Monitor Operations
+# =============================================================================
+
+# There is only ever one local monitor; remember its primary key once found
+_local_monitor_id: Optional[int] = None
+
+
+async def get_local_monitor(db: AsyncSession) -> Optional[Monitor]:
+    """Get the local monitor, by primary key after the first lookup."""
+    global _local_monitor_id
+
+    if _local_monitor_id is not None:
+        monitor = await db.get(Monitor, _local_monitor_id)
+        if monitor is not None and monitor.is_local:
+            return monitor
+        # Deleted or demoted since we cached it
+        _local_monitor_id = None
+
+    result = await db.execute(select(Monitor).where(Monitor.is_local == True))
+    monitor = result.scalar_one_or_none()
+    if monitor is not None:
+        _local_monitor_id = monitor.id
+    return monitor
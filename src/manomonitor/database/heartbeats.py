@@ -0,0 +1,108 @@
+"""Debounced monitor last_seen updates."""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import case, update
+
+from manomonitor.database.connection import get_db_context
+from manomonitor.database.models import Monitor
+
+logger = logging.getLogger(__name__)
+
+
+class MonitorHeartbeats:
+    """
+    Buffers monitor last_seen timestamps and writes them out periodically.
+
+    Secondary monitors report every few seconds, and each report used to
+    UPDATE its monitor row. Only the latest timestamp per monitor matters, so
+    reports just record it here and a background task writes all pending
+    timestamps in a single UPDATE.
+    """
+
+    def __init__(self, flush_interval: float = 5.0):
+        self._pending: dict[int, datetime] = {}
+        self._running = False
+        self._task: Optional[asyncio.Task] = None
+        self._flush_interval = flush_interval
+
+    def touch(self, monitor_id: int, when: datetime) -> None:
+        """Record that a monitor was seen (written on the next flush)."""
+        self._pending[monitor_id] = when
+
+    async def flush(self) -> int:
+        """Write all pending timestamps. Returns the number of monitors updated."""
+        if not self._pending:
+            return 0
+
+        pending, self._pending = self._pending, {}
+        try:
+            async with get_db_context() as db:
+                await db.execute(
+                    update(Monitor)
+                    .where(Monitor.id.in_(pending))
+                    .values(last_seen=case(pending, value=Monitor.id))
+                    .execution_options(synchronize_session=False)
+                )
+        except Exception:
+            # Keep them for the next attempt, unless a newer one arrived
+            for monitor_id, when in pending.items():
+                self._pending.setdefault(monitor_id, when)
+            raise
+
+        return len(pending)
+
+    async def _flush_loop(self) -> None:
+        """Flush pending timestamps every flush_interval seconds."""
+        while self._running:
+            await asyncio.sleep(self._flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Failed to write monitor heartbeats: {e}")
+
+    async def start(self) -> None:
+        """Start the background flush task."""
+        if self._running:
+            logger.warning("Monitor heartbeat writer already running")
+            return
+
+        self._running = True
+        self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Stop the background task and write anything still pending."""
+        self._running = False
+
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Failed to write monitor heartbeats: {e}")
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the flush task is running."""
+        return self._running and self._task is not None and not self._task.done()
+
+
+# Singleton instance
+_heartbeats_instance: Optional[MonitorHeartbeats] = None
+
+
+def get_monitor_heartbeats() -> MonitorHeartbeats:
+    """Get or create the global MonitorHeartbeats instance."""
+    global _heartbeats_instance
+    if _heartbeats_instance is None:
+        _heartbeats_instance = MonitorHeartbeats()
+    return _heartbeats_instance
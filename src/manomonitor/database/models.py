@@ -172,6 +172,8 @@ class ProbeLog(Base):
 
     __table_args__ = (
         Index("ix_probe_logs_asset_timestamp", "asset_id", "timestamp"),
+        # Covers recent-window scans that group by device (secondary reporter)
+        Index("ix_probe_logs_timestamp_asset_signal", "timestamp", "asset_id", "signal_strength"),
     )
 
     def __repr__(self) -> str:
@@ -332,7 +334,8 @@ class SignalReading(Base):
 
     __table_args__ = (
         Index("ix_signal_readings_asset_monitor", "asset_id", "monitor_id"),
-        # Note: timestamp already has index=True on the column definition
+        # Serves the map query: asset_id IN (...) AND timestamp >= cutoff
+        Index("ix_signal_readings_asset_timestamp", "asset_id", "timestamp"),
     )
 
     def __repr__(self) -> str:
@@ -6,14 +6,16 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 
+from manomonitor.api.responses import ORJSONResponse
 from manomonitor.api.routes import router as api_router
 from manomonitor.api.websocket import router as ws_router
 from manomonitor.capture.monitor import get_capture
 from manomonitor.capture.network import get_arp_monitor, get_dhcp_monitor
 from manomonitor.config import settings
 from manomonitor.database.connection import close_db, init_db
+from manomonitor.database.heartbeats import get_monitor_heartbeats
 from manomonitor.notifications import get_notification_manager
-from manomonitor.web.views import router as web_router
+from manomonitor.web.views import precompile_templates, router as web_router
 
 # Configure logging
 logging.basicConfig(
@@ -50,15 +52,15 @@ async def _load_db_settings():
             "signal_averaging_window": int,
         }
 
-        updated = []
+        values = {}
         for key, converter in setting_map.items():
             if key in db_config:
                 try:
-                    value = converter(db_config[key])
-                    setattr(settings, key, value)
-                    updated.append(key)
+                    values[key] = converter(db_config[key])
                 except (ValueError, TypeError):
                     pass
+        settings.apply(values)
+        updated = list(values)
 
         if updated:
             logger.info(f"Loaded settings from database: {', '.join(updated)}")
@@ -67,8 +69,8 @@ async def _load_db_settings():
 async def _setup_local_monitor():
     """Set up the local monitor with configured or auto-detected location."""
     import secrets
-    from sqlalchemy import select
     from manomonitor.database.connection import get_db_context
+    from manomonitor.database.crud import get_local_monitor
     from manomonitor.database.models import Monitor
 
     lat = settings.monitor_latitude
@@ -116,8 +118,7 @@ async def _setup_local_monitor():
 
     async with get_db_context() as db:
         # Check for existing local monitor
-        result = await db.execute(select(Monitor).where(Monitor.is_local == True))
-        monitor = result.scalar_one_or_none()
+        monitor = await get_local_monitor(db)
 
         from datetime import datetime
 
@@ -282,6 +283,16 @@ async def lifespan(app: FastAPI):
     await manager.start()
     logger.info("Notification manager started")
 
+    # Compile UI templates before the first page request
+    try:
+        logger.info(f"Precompiled {precompile_templates()} templates")
+    except Exception as e:
+        logger.warning(f"Failed to precompile templates: {e}")
+
+    # Start batched monitor last_seen writes
+    heartbeats = get_monitor_heartbeats()
+    await heartbeats.start()
+
     logger.info(f"ManoMonitor ready at http://{settings.host}:{settings.port}")
 
     yield
@@ -304,6 +315,9 @@ async def lifespan(app: FastAPI):
     # Stop notification manager
     await manager.stop()
 
+    # Write any pending monitor last_seen updates
+    await heartbeats.stop()
+
     # Close database
     await close_db()
 
@@ -316,6 +330,7 @@ app = FastAPI(
     description="WiFi-based presence detection and proximity alert system",
     version="2.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Mount static files
@@ -337,6 +352,9 @@ def run():
         port=settings.port,
         reload=settings.debug,
         log_level="debug" if settings.debug else "info",
+        # Compress WebSocket update frames (they are repetitive JSON)
+        ws_per_message_deflate=True,
+        ws_ping_interval=20.0,
     )
 
 
@@ -2,6 +2,7 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Optional
 
 from manomonitor.database.models import Asset
@@ -30,14 +31,12 @@ class NotificationPayload:
     @classmethod
     def from_asset(cls, asset: Asset, event_type: str = "detected") -> "NotificationPayload":
         """Create a payload from an Asset."""
-        from datetime import datetime
-
         return cls(
             device_name=asset.display_name,
             mac_address=asset.mac_address,
             signal_strength=asset.last_signal_strength,
             event_type=event_type,
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=datetime.now(timezone.utc).isoformat(),
         )
 
 
@@ -69,6 +68,22 @@ class BaseNotifier(ABC):
         """
         pass
 
+    async def send_batch(
+        self, payloads: list[NotificationPayload]
+    ) -> list[NotificationResult]:
+        """
+        Send several notifications raised together.
+
+        Returns one result per payload. By default each payload is sent on its
+        own; notifiers that can coalesce a burst into fewer requests override
+        this.
+        """
+        return [await self.send(payload) for payload in payloads]
+
+    async def close(self) -> None:
+        """Release any resources (e.g. HTTP connections) held by the notifier."""
+        pass
+
     async def test(self) -> NotificationResult:
         """Send a test notification."""
         test_payload = NotificationPayload(
@@ -1,14 +1,28 @@
 """IFTTT webhook notification provider."""
 
+import asyncio
 import logging
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
 
 import httpx
+import orjson
 
 from manomonitor.config import settings
 from manomonitor.notifications.base import BaseNotifier, NotificationPayload, NotificationResult
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 needs the h2 package (httpx[http2]); fall back to HTTP/1.1 without it
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
 
 class IFTTTNotifier(BaseNotifier):
     """
@@ -22,6 +36,25 @@ class IFTTTNotifier(BaseNotifier):
 
     WEBHOOK_URL = "https://maker.ifttt.com/trigger/{event}/with/key/{key}"
 
+    # Transient failures are retried with capped, decorrelated-jitter backoff;
+    # any other non-200 response is treated as permanent.
+    RETRY_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+    MAX_RETRIES = 3
+    RETRY_BASE_DELAY = 1.0  # seconds
+    RETRY_MAX_DELAY = 30.0  # seconds
+
+    _JSON_HEADERS = {"Content-Type": "application/json"}
+
+    # Shared result for every send while IFTTT isn't configured
+    _DISABLED_RESULT = NotificationResult(
+        success=False,
+        notifier_type="ifttt",
+        error="IFTTT not configured",
+    )
+
+    # Bursts of events are sent as summary webhooks of up to this many devices
+    MAX_BATCH = 10
+
     def __init__(
         self,
         webhook_key: str = settings.ifttt_webhook_key,
@@ -30,54 +63,181 @@ class IFTTTNotifier(BaseNotifier):
         self.webhook_key = webhook_key
         self.event_name = event_name
 
+        # Driven by startup settings, which don't change while running
+        self._configured = bool(settings.ifttt_enabled and self.webhook_key)
+
+        # Long-lived client so notifications reuse the keep-alive connection
+        # to maker.ifttt.com instead of a new TCP+TLS handshake each time.
+        # Over HTTP/2 concurrent sends are multiplexed on that one connection.
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get or create HTTP client."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                http2=_HTTP2_AVAILABLE,
+                timeout=10.0,
+                # Single destination: a handful of connections is plenty
+                limits=httpx.Limits(
+                    max_keepalive_connections=4,
+                    max_connections=8,
+                    keepalive_expiry=60,
+                ),
+            )
+        return self._http_client
+
+    async def close(self) -> None:
+        """Close HTTP client."""
+        if self._http_client:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    def _retry_delay(self, previous: float, response: Optional[httpx.Response] = None) -> float:
+        """
+        Seconds to wait before the next attempt (Retry-After wins if given).
+
+        Otherwise uses decorrelated jitter: uniform over [base, previous * 3],
+        capped. Each wait depends on the previous one rather than the attempt
+        number, which spreads out retries from notifiers that failed together.
+        """
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    when = parsedate_to_datetime(retry_after)
+                    delay = (when - datetime.now(timezone.utc)).total_seconds()
+                except (TypeError, ValueError):
+                    delay = None
+            if delay is not None:
+                return min(max(delay, 0.0), self.RETRY_MAX_DELAY)
+
+        upper = max(previous, self.RETRY_BASE_DELAY) * 3
+        return min(self.RETRY_MAX_DELAY, random.uniform(self.RETRY_BASE_DELAY, upper))
+
+    async def _post_with_retry(self, url: str, data: dict) -> httpx.Response:
+        """
+        POST to IFTTT, retrying timeouts, connection errors and transient statuses.
+
+        Returns the last response received; raises the transport error if the
+        final attempt didn't get one.
+        """
+        client = self._get_http_client()
+        body = orjson.dumps(data)  # serialized once, reused across retries
+        delay = self.RETRY_BASE_DELAY
+
+        for attempt in range(self.MAX_RETRIES + 1):
+            response = None
+            try:
+                response = await client.post(url, content=body, headers=self._JSON_HEADERS)
+            except httpx.TransportError as e:
+                if attempt == self.MAX_RETRIES:
+                    raise
+                reason = str(e) or type(e).__name__
+            else:
+                if response.status_code not in self.RETRY_STATUS_CODES or attempt == self.MAX_RETRIES:
+                    return response
+                reason = f"status {response.status_code}"
+
+            delay = self._retry_delay(delay, response)
+            logger.warning(
+                f"IFTTT request failed ({reason}), retrying in {delay:.1f}s "
+                f"[{attempt + 1}/{self.MAX_RETRIES}]"
+            )
+            await asyncio.sleep(delay)
+
     @property
     def name(self) -> str:
         return "ifttt"
 
     @property
     def is_configured(self) -> bool:
-        return bool(settings.ifttt_enabled and self.webhook_key)
+        return self._configured
 
     async def send(self, payload: NotificationPayload) -> NotificationResult:
         """Send notification to IFTTT."""
-        if not self.is_configured:
-            return NotificationResult(
-                success=False,
-                notifier_type=self.name,
-                error="IFTTT not configured",
+        # IFTTT accepts value1, value2, value3
+        return await self._trigger(
+            {
+                "value1": payload.device_name,
+                "value2": f"Signal: {payload.signal_strength}dBm | MAC: {payload.mac_address}",
+                "value3": payload.timestamp,
+            },
+            payload.device_name,
+        )
+
+    async def send_batch(
+        self, payloads: list[NotificationPayload]
+    ) -> list[NotificationResult]:
+        """
+        Send a burst of notifications as summary webhooks.
+
+        Each group of up to MAX_BATCH payloads becomes a single request
+        ("3 events: Phone (-60dBm), ..."), keeping bursts under IFTTT's rate
+        limits. A lone payload is sent as a normal notification.
+        """
+        results: list[NotificationResult] = []
+
+        for start in range(0, len(payloads), self.MAX_BATCH):
+            batch = payloads[start:start + self.MAX_BATCH]
+            if len(batch) == 1:
+                results.append(await self.send(batch[0]))
+                continue
+
+            summary = ", ".join(
+                f"{p.device_name} ({p.signal_strength}dBm)" for p in batch
+            )
+            result = await self._trigger(
+                {
+                    "value1": f"{len(batch)} devices",
+                    "value2": f"{len(batch)} events: {summary}",
+                    "value3": max(p.timestamp for p in batch),
+                },
+                f"{len(batch)} devices",
             )
+            results.extend([result] * len(batch))
 
-        url = self.WEBHOOK_URL.format(event=self.event_name, key=self.webhook_key)
+        return results
 
-        # IFTTT accepts value1, value2, value3
-        data = {
-            "value1": payload.device_name,
-            "value2": f"Signal: {payload.signal_strength}dBm | MAC: {payload.mac_address}",
-            "value3": payload.timestamp,
-        }
+    async def _trigger(self, data: dict, description: str) -> NotificationResult:
+        """Fire the IFTTT webhook event with the given values."""
+        if not self._configured:
+            return self._DISABLED_RESULT
+
+        url = self.WEBHOOK_URL.format(event=self.event_name, key=self.webhook_key)
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(url, json=data)
-
-                if response.status_code == 200:
-                    logger.info(f"IFTTT notification sent for {payload.device_name}")
-                    return NotificationResult(
-                        success=True,
-                        notifier_type=self.name,
-                        message=f"Notification sent: {payload.device_name}",
-                    )
-                else:
-                    error = f"IFTTT returned {response.status_code}: {response.text}"
-                    logger.error(error)
-                    return NotificationResult(
-                        success=False,
-                        notifier_type=self.name,
-                        error=error,
-                    )
+            response = await self._post_with_retry(url, data)
+
+            if response.status_code == 200:
+                logger.info(f"IFTTT notification sent for {description}")
+                return NotificationResult(
+                    success=True,
+                    notifier_type=self.name,
+                    message=f"Notification sent: {description}",
+                )
+            else:
+                error = f"IFTTT returned {response.status_code}: {response.text}"
+                if response.status_code in self.RETRY_STATUS_CODES:
+                    error = f"Max retries exceeded: {error}"
+                logger.error(error)
+                return NotificationResult(
+                    success=False,
+                    notifier_type=self.name,
+                    error=error,
+                )
 
         except httpx.TimeoutException:
-            error = "IFTTT request timed out"
+            error = "Max retries exceeded: IFTTT request timed out"
+            logger.error(error)
+            return NotificationResult(
+                success=False,
+                notifier_type=self.name,
+                error=error,
+            )
+        except httpx.TransportError as e:
+            error = f"Max retries exceeded: IFTTT error: {e}"
             logger.error(error)
             return NotificationResult(
                 success=False,
@@ -29,6 +29,7 @@ class NotificationManager:
 
     def __init__(self):
         self.notifiers: list[BaseNotifier] = []
+        self._notifier_names: tuple[str, ...] = ()
         self._running = False
         self._task: Optional[asyncio.Task] = None
         self._check_interval = 5  # seconds
@@ -53,6 +54,13 @@ class NotificationManager:
         if not self.notifiers:
             logger.warning("No notification providers configured")
 
+        self._notifier_names = tuple(n.name for n in self.notifiers)
+
+    @property
+    def notifier_names(self) -> tuple[str, ...]:
+        """Names of the configured notifiers."""
+        return self._notifier_names
+
     def get_notifier(self, name: str) -> Optional[BaseNotifier]:
         """Get a specific notifier by name."""
         for notifier in self.notifiers:
@@ -118,6 +126,46 @@ class NotificationManager:
 
         return results
 
+    async def notify_devices(self, assets: list[Asset], event_type: str = "detected") -> None:
+        """
+        Send notifications for several devices found in the same check.
+
+        Each notifier gets the whole group via send_batch, so providers that
+        support it can coalesce a burst into fewer requests.
+
+        Args:
+            assets: The devices to notify about.
+            event_type: Type of event (detected, new_device, etc.)
+        """
+        if not assets or not self.notifiers:
+            return
+
+        payloads = [NotificationPayload.from_asset(asset, event_type) for asset in assets]
+        notified: set[int] = set()
+
+        for notifier in self.notifiers:
+            results = await notifier.send_batch(payloads)
+
+            # Log the notification attempts
+            async with get_db_context() as db:
+                for asset, result in zip(assets, results):
+                    await log_notification(
+                        db,
+                        asset_id=asset.id,
+                        notification_type=notifier.name,
+                        status="sent" if result.success else "failed",
+                        message=result.message,
+                        error=result.error,
+                    )
+                    if result.success:
+                        notified.add(asset.id)
+
+        # Update last notified time where any notification succeeded
+        if notified:
+            async with get_db_context() as db:
+                for asset_id in notified:
+                    await update_asset_notification_time(db, asset_id)
+
     async def _check_and_notify(self) -> None:
         """Check for devices that need notifications and send them."""
         try:
@@ -127,16 +175,16 @@ class NotificationManager:
 
                 for asset in assets:
                     logger.info(f"Sending notification for {asset.display_name}")
-                    await self.notify_device(asset, event_type="detected")
+                await self.notify_devices(list(assets), event_type="detected")
 
                 # Check for newly discovered devices if enabled
                 if settings.notify_new_devices:
                     new_assets = await get_newly_discovered_assets(db, since_minutes=1)
-                    for asset in new_assets:
-                        # Only notify if not already notified
-                        if asset.last_notified is None:
-                            logger.info(f"Sending new device notification for {asset.mac_address}")
-                            await self.notify_device(asset, event_type="new_device")
+                    # Only notify if not already notified
+                    unnotified = [a for a in new_assets if a.last_notified is None]
+                    for asset in unnotified:
+                        logger.info(f"Sending new device notification for {asset.mac_address}")
+                    await self.notify_devices(unnotified, event_type="new_device")
 
         except Exception as e:
             logger.error(f"Error in notification check: {e}")
@@ -171,6 +219,9 @@ class NotificationManager:
                 pass
             self._task = None
 
+        for notifier in self.notifiers:
+            await notifier.close()
+
         logger.info("Notification manager stopped")
 
     @property
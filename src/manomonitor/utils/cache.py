@@ -0,0 +1,63 @@
+"""Small in-process TTL cache for expensive, staleness-tolerant results."""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+
+class TTLCache:
+    """
+    In-memory cache whose entries expire after a fixed number of seconds.
+
+    Intended for results that are polled frequently but can be a few seconds
+    stale (status endpoints, hardware probes, etc.). Not shared between
+    processes.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._locks: dict[Hashable, asyncio.Lock] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value for key."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    async def get_or_set(
+        self, key: Hashable, factory: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Return the cached value for key, computing it with factory() on a miss.
+
+        Concurrent misses for the same key share a single factory() call.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            value = self.get(key)
+            if value is None:
+                value = await factory()
+                self.set(key, value)
+            return value
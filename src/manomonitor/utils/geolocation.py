@@ -17,6 +17,8 @@ from typing import Optional
 
 import httpx
 
+from manomonitor.utils.cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,13 +44,27 @@ class WifiAccessPoint:
 # =============================================================================
 
 
+# Device enumeration is stable over minutes; remember it briefly
+_gps_device_cache = TTLCache(ttl=30.0)
+
+
+def clear_gps_device_cache() -> None:
+    """Forget remembered GPS devices (e.g. after a dongle is plugged in)."""
+    _gps_device_cache.clear()
+
+
 def find_gps_devices() -> list[str]:
     """
     Find connected GPS devices.
 
     Looks for common USB GPS device paths on Linux.
     Returns list of device paths (e.g., ['/dev/ttyACM0', '/dev/ttyUSB0'])
+    Results are cached for 30 seconds.
     """
+    cached = _gps_device_cache.get("devices")
+    if cached is not None:
+        return list(cached)
+
     gps_devices = []
 
     # Common GPS device patterns
@@ -67,7 +83,9 @@ def find_gps_devices() -> list[str]:
         if os.path.exists(device) and os.access(device, os.R_OK):
             valid_devices.append(device)
 
-    return sorted(valid_devices)
+    valid_devices.sort()
+    _gps_device_cache.set("devices", tuple(valid_devices))
+    return valid_devices
 
 
 def parse_nmea_coordinate(coord: str, direction: str) -> Optional[float]:
@@ -220,59 +238,82 @@ async def read_gps_location(
         return None
 
 
+# NMEA sentences are at most 82 characters; anything longer without a line
+# break is noise, so the read buffer never needs to hold more than this.
+_NMEA_BUFFER_SIZE = 256
+
+
+def _parse_nmea_fix(sentence: str) -> Optional[GeoLocation]:
+    """Parse a GGA (preferred, has accuracy) or RMC sentence into a fix."""
+    if sentence.startswith(("$GPGGA", "$GNGGA")):
+        return parse_nmea_gga(sentence)
+    if sentence.startswith(("$GPRMC", "$GNRMC")):
+        return parse_nmea_rmc(sentence)
+    return None
+
+
+def _parse_nmea_lines(buffer: bytes) -> tuple[Optional[GeoLocation], bytes]:
+    """
+    Parse the complete lines in buffer.
+
+    Returns the first valid fix (if any) and the unconsumed tail, trimmed to
+    _NMEA_BUFFER_SIZE bytes.
+    """
+    *lines, rest = buffer.split(b"\n")
+    for line in lines:
+        location = _parse_nmea_fix(line.decode("ascii", errors="ignore").strip())
+        if location:
+            logger.info(f"GPS fix: {location.latitude}, {location.longitude} (accuracy: {location.accuracy}m)")
+            return location, b""
+    return None, rest[-_NMEA_BUFFER_SIZE:]
+
+
 async def _read_gps_serial(
     device_path: str,
     timeout: float,
     baud_rate: int,
 ) -> Optional[GeoLocation]:
-    """Read GPS using pyserial."""
+    """
+    Read GPS using pyserial.
+
+    The port is opened non-blocking and watched by the event loop, so each
+    sentence is parsed as soon as its bytes arrive, without a thread pool
+    round-trip per line.
+    """
     import serial
 
     try:
         ser = serial.Serial(
             device_path,
             baudrate=baud_rate,
-            timeout=1.0,
+            timeout=0,  # Non-blocking reads
         )
     except serial.SerialException as e:
         logger.error(f"Failed to open GPS device: {e}")
         return None
 
-    try:
-        start_time = asyncio.get_event_loop().time()
-
-        while (asyncio.get_event_loop().time() - start_time) < timeout:
-            # Run blocking read in thread pool
-            line = await asyncio.get_event_loop().run_in_executor(
-                None, ser.readline
-            )
-
-            if not line:
-                continue
+    loop = asyncio.get_running_loop()
+    readable = asyncio.Event()
+    loop.add_reader(ser.fileno(), readable.set)
 
-            try:
-                sentence = line.decode('ascii', errors='ignore').strip()
-            except Exception:
-                continue
-
-            # Try to parse as GGA (preferred, has accuracy)
-            if sentence.startswith('$GPGGA') or sentence.startswith('$GNGGA'):
-                location = parse_nmea_gga(sentence)
-                if location:
-                    logger.info(f"GPS fix: {location.latitude}, {location.longitude} (accuracy: {location.accuracy}m)")
-                    return location
-
-            # Try RMC as fallback
-            elif sentence.startswith('$GPRMC') or sentence.startswith('$GNRMC'):
-                location = parse_nmea_rmc(sentence)
+    try:
+        buffer = b""
+        async with asyncio.timeout(timeout):
+            while True:
+                await readable.wait()
+                readable.clear()
+
+                buffer += ser.read(ser.in_waiting or 1)
+                location, buffer = _parse_nmea_lines(buffer)
                 if location:
-                    logger.info(f"GPS fix: {location.latitude}, {location.longitude}")
                     return location
 
+    except TimeoutError:
         logger.warning("GPS timeout - no valid fix obtained")
         return None
 
     finally:
+        loop.remove_reader(ser.fileno())
         ser.close()
 
 
@@ -294,52 +335,38 @@ async def _read_gps_cat(device_path: str, timeout: float) -> Optional[GeoLocatio
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.DEVNULL,
         )
+    except Exception as e:
+        logger.error(f"GPS cat read failed: {e}")
+        return None
 
-        start_time = asyncio.get_event_loop().time()
-        buffer = ""
-
-        while (asyncio.get_event_loop().time() - start_time) < timeout:
-            try:
-                # Read with timeout
-                data = await asyncio.wait_for(
-                    proc.stdout.read(256),
-                    timeout=2.0
-                )
+    try:
+        buffer = b""
+        async with asyncio.timeout(timeout):
+            while True:
+                # Returns as soon as any bytes are available
+                data = await proc.stdout.read(_NMEA_BUFFER_SIZE)
                 if not data:
                     break
 
-                buffer += data.decode('ascii', errors='ignore')
-
-                # Process complete lines
-                while '\n' in buffer:
-                    line, buffer = buffer.split('\n', 1)
-                    sentence = line.strip()
-
-                    if sentence.startswith('$GPGGA') or sentence.startswith('$GNGGA'):
-                        location = parse_nmea_gga(sentence)
-                        if location:
-                            proc.terminate()
-                            logger.info(f"GPS fix: {location.latitude}, {location.longitude}")
-                            return location
-
-                    elif sentence.startswith('$GPRMC') or sentence.startswith('$GNRMC'):
-                        location = parse_nmea_rmc(sentence)
-                        if location:
-                            proc.terminate()
-                            logger.info(f"GPS fix: {location.latitude}, {location.longitude}")
-                            return location
-
-            except asyncio.TimeoutError:
-                continue
+                buffer += data
+                location, buffer = _parse_nmea_lines(buffer)
+                if location:
+                    return location
 
-        proc.terminate()
-        logger.warning("GPS timeout - no valid fix obtained")
-        return None
+    except TimeoutError:
+        pass
 
     except Exception as e:
         logger.error(f"GPS cat read failed: {e}")
         return None
 
+    finally:
+        if proc.returncode is None:
+            proc.terminate()
+
+    logger.warning("GPS timeout - no valid fix obtained")
+    return None
+
 
 async def geolocate_via_gps(
     device_path: Optional[str] = None,
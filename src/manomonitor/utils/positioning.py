@@ -6,6 +6,7 @@ from multiple monitoring stations.
 
 import math
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 
@@ -89,6 +90,43 @@ class PositionEstimate:
     confidence: float  # 0-1 confidence score
 
 
+class SignalCalibration:
+    """
+    Log-distance path loss model for one tx_power / path loss exponent pair.
+
+    distance = 10 ^ ((TxPower - RSSI) / (10 * n)) is evaluated as
+    exp((TxPower - RSSI) * k) with k = ln(10) / (10 * n) precomputed, so each
+    conversion is a multiply and an exp rather than a division and a pow.
+    """
+
+    __slots__ = ("tx_power", "path_loss_exponent", "_k")
+
+    def __init__(self, tx_power: int = -59, path_loss_exponent: float = 3.0):
+        self.tx_power = tx_power
+        self.path_loss_exponent = path_loss_exponent
+        self._k = math.log(10) / (10 * path_loss_exponent)
+
+    def distance(self, signal_dbm: float) -> float:
+        """Estimated distance in meters, clamped to a reasonable indoor range."""
+        if signal_dbm >= self.tx_power:
+            return 0.5  # Very close, minimum distance
+
+        distance = math.exp((self.tx_power - signal_dbm) * self._k)
+        return min(max(distance, 0.5), 100.0)
+
+
+@lru_cache(maxsize=8)
+def signal_calibration(
+    tx_power: int = -59,
+    path_loss_exponent: float = 3.0,
+) -> SignalCalibration:
+    """Get the (shared) calibration for the given settings values."""
+    return SignalCalibration(tx_power, path_loss_exponent)
+
+
+# Signals are integer dBm in a narrow range and the calibration values are
+# settings, so the same few hundred inputs recur on every report and map poll.
+@lru_cache(maxsize=256)
 def signal_to_distance(
     signal_dbm: int,
     tx_power: int = -59,  # Typical transmit power at 1m
@@ -108,14 +146,7 @@ def signal_to_distance(
     Returns:
         Estimated distance in meters
     """
-    if signal_dbm >= tx_power:
-        return 0.5  # Very close, minimum distance
-
-    exponent = (tx_power - signal_dbm) / (10 * path_loss_exponent)
-    distance = math.pow(10, exponent)
-
-    # Clamp to reasonable indoor range
-    return min(max(distance, 0.5), 100.0)
+    return signal_calibration(tx_power, path_loss_exponent).distance(signal_dbm)
 
 
 def bilaterate(
@@ -1,16 +1,22 @@
 """Web views for HTMX-based UI."""
 
+import asyncio
+import hashlib
+from bisect import bisect_right
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Form, Query, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from manomonitor.capture.monitor import get_capture
 from manomonitor.config import settings
-from manomonitor.database.connection import get_db
+from manomonitor.database.connection import get_db, get_db_context
 from manomonitor.database.crud import (
     get_all_assets,
     get_asset_by_id,
@@ -20,13 +26,51 @@ from manomonitor.database.crud import (
     get_statistics,
     update_asset,
 )
+from manomonitor.database.models import Asset, Monitor
 from manomonitor.notifications import get_notification_manager
+from manomonitor.utils.cache import TTLCache
 
 router = APIRouter(tags=["web"])
 
 # Initialize templates
 templates = Jinja2Templates(directory=str(settings.templates_dir))
 
+# Keep compiled templates on disk so a restart doesn't re-parse them, and only
+# check template mtimes for changes while developing
+_template_cache_dir = settings.data_dir / "cache" / "jinja"
+try:
+    _template_cache_dir.mkdir(parents=True, exist_ok=True)
+    templates.env.bytecode_cache = FileSystemBytecodeCache(
+        directory=str(_template_cache_dir),
+        pattern="__jinja2_%s.cache",
+    )
+except OSError:
+    pass  # Read-only data dir: fall back to the in-memory cache only
+templates.env.auto_reload = settings.debug
+
+
+def precompile_templates() -> int:
+    """
+    Load (parse and compile) every template up front.
+
+    Called at startup so the first request to each page or HTMX partial
+    doesn't pay for compilation. Returns the number of templates loaded.
+    """
+    names = templates.env.list_templates(extensions=["html"])
+    for name in names:
+        templates.env.get_template(name)
+    return len(names)
+
+
+# Dashboard statistics are polled every few seconds from every open tab; the
+# aggregate counts can be a few seconds stale
+_stats_cache = TTLCache(ttl=3.0)
+
+
+async def _cached_statistics(db: AsyncSession) -> dict:
+    """get_statistics(), shared between requests for a few seconds."""
+    return await _stats_cache.get_or_set("stats", lambda: get_statistics(db))
+
 
 # Custom template filters
 def format_datetime(value: datetime | None) -> str:
@@ -36,6 +80,7 @@ def format_datetime(value: datetime | None) -> str:
     return value.strftime("%Y-%m-%d %H:%M:%S")
 
 
+@lru_cache(maxsize=256)
 def format_relative_time(minutes: int) -> str:
     """Format minutes as relative time string."""
     if minutes < 0:
@@ -57,18 +102,16 @@ def format_relative_time(minutes: int) -> str:
     return f"{days} days ago"
 
 
+# Lower bounds of each signal quality band (dBm), weakest band first
+_SIGNAL_THRESHOLDS = (-70, -60, -50)
+_SIGNAL_LABELS = ("Weak", "Fair", "Good", "Excellent")
+
+
 def format_signal(signal: int | None) -> str:
     """Format signal strength with quality indicator."""
     if signal is None:
         return "N/A"
-    if signal >= -50:
-        quality = "Excellent"
-    elif signal >= -60:
-        quality = "Good"
-    elif signal >= -70:
-        quality = "Fair"
-    else:
-        quality = "Weak"
+    quality = _SIGNAL_LABELS[bisect_right(_SIGNAL_THRESHOLDS, signal)]
     return f"{signal} dBm ({quality})"
 
 
@@ -93,7 +136,7 @@ async def index(
     db: AsyncSession = Depends(get_db),
 ):
     """Main dashboard page."""
-    stats = await get_statistics(db)
+    stats = await _cached_statistics(db)
     capture = get_capture()
     manager = get_notification_manager()
 
@@ -128,7 +171,13 @@ async def device_detail_page(
     db: AsyncSession = Depends(get_db),
 ):
     """Device detail page."""
-    asset = await get_asset_by_id(db, asset_id)
+    # An AsyncSession runs one statement at a time, so load the SSID history
+    # on a second session concurrently with the asset
+    async def _ssids():
+        async with get_db_context() as ssid_db:
+            return await get_ssid_history(ssid_db, asset_id)
+
+    asset, ssids = await asyncio.gather(get_asset_by_id(db, asset_id), _ssids())
     if not asset:
         return templates.TemplateResponse(
             "error.html",
@@ -136,8 +185,6 @@ async def device_detail_page(
             status_code=404,
         )
 
-    ssids = await get_ssid_history(db, asset_id)
-
     return templates.TemplateResponse(
         "device_detail.html",
         {
@@ -161,7 +208,7 @@ async def settings_page(
         {
             "request": request,
             "settings": settings,
-            "notifiers": [n.name for n in manager.notifiers],
+            "notifiers": manager.notifier_names,
         },
     )
 
@@ -186,9 +233,6 @@ async def monitors_page(
     db: AsyncSession = Depends(get_db),
 ):
     """Monitors management page."""
-    from sqlalchemy import select
-    from manomonitor.database.models import Monitor
-
     # Get all monitors
     result = await db.execute(select(Monitor).where(Monitor.is_active == True))
     monitors = result.scalars().all()
@@ -215,17 +259,21 @@ async def map_page(
     db: AsyncSession = Depends(get_db),
 ):
     """Device location map page."""
-    from sqlalchemy import select
-    from manomonitor.database.models import Monitor
-
-    # Get monitors
-    result = await db.execute(select(Monitor).where(Monitor.is_active == True))
-    monitors = result.scalars().all()
+    # Markers are loaded client-side from /api/map/data; the page itself only
+    # needs the monitor count and their average position
+    result = await db.execute(
+        select(
+            func.count(Monitor.id),
+            func.avg(Monitor.latitude),
+            func.avg(Monitor.longitude),
+        ).where(Monitor.is_active == True)
+    )
+    monitor_count, avg_lat, avg_lon = result.one()
 
     # Calculate center
-    if monitors:
-        center_lat = sum(m.latitude for m in monitors) / len(monitors)
-        center_lon = sum(m.longitude for m in monitors) / len(monitors)
+    if monitor_count:
+        center_lat = avg_lat
+        center_lon = avg_lon
     elif settings.monitor_latitude != 0:
         center_lat = settings.monitor_latitude
         center_lon = settings.monitor_longitude
@@ -237,7 +285,7 @@ async def map_page(
         "map.html",
         {
             "request": request,
-            "monitors": monitors,
+            "monitor_count": monitor_count,
             "center_lat": center_lat,
             "center_lon": center_lon,
             "map_enabled": settings.map_enabled,
@@ -251,6 +299,67 @@ async def map_page(
 # =============================================================================
 
 
+def _asset_fingerprint(asset: Asset) -> tuple:
+    """
+    Everything about an asset that the partial templates render.
+
+    The rendered fields are listed directly rather than relying on
+    updated_at, which SQLite stores to the second, so an edit landing in the
+    same second as a capture update still changes the ETag.
+    """
+    return (
+        asset.id,
+        asset.mac_address,
+        asset.nickname,
+        asset.vendor,
+        asset.device_type,
+        asset.notify_enabled,
+        asset.is_hidden,
+        asset.last_seen,
+        asset.times_seen,
+        asset.last_signal_strength,
+        asset.minutes_since_seen,
+        asset.is_present,
+    )
+
+
+# Template output pieces to collect before sending a chunk when streaming
+_STREAM_BUFFER_SIZE = 40
+
+
+def _etag(*parts) -> str:
+    """Build a quoted ETag from the data a partial is rendered from."""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=8).hexdigest()
+    return f'"{digest}"'
+
+
+def _render_partial(
+    request: Request, name: str, context: dict, etag: str, stream: bool = False
+) -> Response:
+    """
+    Render a partial template, or answer 304 if the client already has it.
+
+    HTMX polls these partials every few seconds; when nothing changed the
+    browser revalidates with If-None-Match and we skip rendering entirely.
+
+    With stream=True the template is rendered incrementally and sent in
+    chunks, so large lists never sit in memory as one string and the first
+    rows reach the browser sooner.
+    """
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    if stream:
+        chunks = templates.get_template(name).stream({"request": request, **context})
+        chunks.enable_buffering(_STREAM_BUFFER_SIZE)
+        return StreamingResponse(chunks, media_type="text/html", headers=headers)
+
+    return templates.TemplateResponse(
+        name, {"request": request, **context}, headers=headers
+    )
+
+
 @router.get("/htmx/devices-table", response_class=HTMLResponse)
 async def htmx_devices_table(
     request: Request,
@@ -265,22 +374,42 @@ async def htmx_devices_table(
     """HTMX partial for devices table."""
     offset = (page - 1) * per_page
 
-    assets = await get_all_assets(
-        db,
-        limit=per_page,
-        offset=offset,
-        search=search,
-        include_hidden=show_hidden,
-        notify_only=notify_only,
-        present_only=present_only,
+    # Count on a second session so both queries run concurrently
+    async def _count() -> int:
+        async with get_db_context() as count_db:
+            return await get_assets_count(
+                count_db, include_hidden=show_hidden, notify_only=notify_only
+            )
+
+    assets, total = await asyncio.gather(
+        get_all_assets(
+            db,
+            limit=per_page,
+            offset=offset,
+            search=search,
+            include_hidden=show_hidden,
+            notify_only=notify_only,
+            present_only=present_only,
+        ),
+        _count(),
     )
-    total = await get_assets_count(db, include_hidden=show_hidden, notify_only=notify_only)
     total_pages = (total + per_page - 1) // per_page
 
-    return templates.TemplateResponse(
+    etag = _etag(
+        total,
+        page,
+        per_page,
+        search,
+        show_hidden,
+        notify_only,
+        present_only,
+        [_asset_fingerprint(asset) for asset in assets],
+    )
+
+    return _render_partial(
+        request,
         "partials/devices_table.html",
         {
-            "request": request,
             "assets": assets,
             "total": total,
             "page": page,
@@ -291,6 +420,8 @@ async def htmx_devices_table(
             "notify_only": notify_only,
             "present_only": present_only,
         },
+        etag,
+        stream=True,
     )
 
 
@@ -300,16 +431,17 @@ async def htmx_stats(
     db: AsyncSession = Depends(get_db),
 ):
     """HTMX partial for stats display."""
-    stats = await get_statistics(db)
+    stats = await _cached_statistics(db)
     capture = get_capture()
 
-    return templates.TemplateResponse(
+    return _render_partial(
+        request,
         "partials/stats.html",
         {
-            "request": request,
             "stats": stats,
             "capture_running": capture.is_running,
         },
+        _etag(sorted(stats.items()), capture.is_running),
     )
 
 
@@ -324,9 +456,11 @@ async def htmx_device_row(
     if not asset:
         return HTMLResponse("")
 
-    return templates.TemplateResponse(
+    return _render_partial(
+        request,
         "partials/device_row.html",
-        {"request": request, "asset": asset},
+        {"asset": asset},
+        _etag(_asset_fingerprint(asset)),
     )
 
 
@@ -387,10 +521,7 @@ async def htmx_toggle_notify(
     if not asset:
         return HTMLResponse("Device not found", status_code=404)
 
-    await update_asset(db, asset_id=asset_id, notify_enabled=not asset.notify_enabled)
-
-    # Re-fetch to get updated state
-    asset = await get_asset_by_id(db, asset_id)
+    asset = await update_asset(db, asset_id=asset_id, notify_enabled=not asset.notify_enabled)
 
     return templates.TemplateResponse(
         "partials/device_row.html",
@@ -409,10 +540,9 @@ async def htmx_toggle_hidden(
     if not asset:
         return HTMLResponse("Device not found", status_code=404)
 
-    await update_asset(db, asset_id=asset_id, is_hidden=not asset.is_hidden)
+    asset = await update_asset(db, asset_id=asset_id, is_hidden=not asset.is_hidden)
 
     # Return empty to remove from list if now hidden
-    asset = await get_asset_by_id(db, asset_id)
     if asset.is_hidden:
         return HTMLResponse("")
 
@@ -430,7 +560,10 @@ async def htmx_present_devices(
     """HTMX partial for present devices list (dashboard widget)."""
     assets = await get_all_assets(db, limit=10, present_only=True)
 
-    return templates.TemplateResponse(
+    return _render_partial(
+        request,
         "partials/present_devices.html",
-        {"request": request, "assets": assets},
+        {"assets": assets},
+        _etag([_asset_fingerprint(asset) for asset in assets]),
+        stream=True,
     )
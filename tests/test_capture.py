@@ -0,0 +1,83 @@
+"""Tests for probe capture batching."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+from manomonitor.capture import monitor
+from manomonitor.capture.monitor import ProbeCapture, ProbeRequest
+
+
+def _make_capture(probes: int, fail: bool = False) -> tuple[ProbeCapture, list[int]]:
+    """ProbeCapture fed by a fake tshark stream, recording flushed batch sizes."""
+    capture = ProbeCapture(interface="test0")
+    flushed: list[int] = []
+
+    async def capture_loop():
+        for i in range(probes):
+            yield ProbeRequest(f"AA:BB:CC:DD:EE:{i % 256:02X}", -50, None, datetime.utcnow())
+        if fail:
+            raise RuntimeError("tshark died")
+
+    async def flush():
+        if capture._pending:
+            flushed.append(len(capture._pending))
+            capture._pending = []
+            await asyncio.sleep(0.01)  # Slow database
+
+    capture._capture_loop = capture_loop
+    capture._flush = flush
+    return capture, flushed
+
+
+async def test_process_probes_finishes_when_queue_overflows():
+    """Capture ending with more probes than the queue holds must not hang."""
+    capture, flushed = _make_capture(64 * 16 + 64)
+
+    await asyncio.wait_for(capture._process_probes(), timeout=10)
+
+    assert sum(flushed) == 64 * 16 + 64
+    assert max(flushed) <= capture._batch_size
+
+
+async def test_process_probes_stops_when_capture_fails():
+    """A failing capture loop ends processing after the queued probes are stored."""
+    capture, flushed = _make_capture(100, fail=True)
+
+    await asyncio.wait_for(capture._process_probes(), timeout=10)
+
+    assert sum(flushed) == 100
+
+
+async def test_flush_falls_back_to_one_probe_per_transaction(monkeypatch):
+    """A failing batch is retried per probe, so only the bad probe is lost."""
+    stored: list[str] = []
+
+    @asynccontextmanager
+    async def fake_db_context():
+        yield None
+
+    async def failing_bulk(db, probes):
+        raise RuntimeError("batch failed")
+
+    async def store_one(db, mac_address, signal_strength=None, ssid=None):
+        if mac_address.endswith(":02"):
+            raise RuntimeError("bad probe")
+        stored.append(mac_address)
+        return None, mac_address.endswith(":00")
+
+    monkeypatch.setattr(monitor, "get_db_context", fake_db_context)
+    monkeypatch.setattr(monitor, "create_or_update_assets_bulk", failing_bulk)
+    monkeypatch.setattr(monitor, "create_or_update_asset", store_one)
+
+    seen: list[ProbeRequest] = []
+    capture = ProbeCapture(interface="test0", on_probe=seen.append)
+    capture._pending = [
+        ProbeRequest(f"AA:BB:CC:DD:EE:{i:02X}", -50, None, datetime.utcnow()) for i in range(4)
+    ]
+
+    await capture._flush()
+
+    assert stored == ["AA:BB:CC:DD:EE:00", "AA:BB:CC:DD:EE:01", "AA:BB:CC:DD:EE:03"]
+    assert [probe.mac_address for probe in seen] == stored
+    assert capture._pending == []